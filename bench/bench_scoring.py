@@ -0,0 +1,209 @@
+"""
+Benchmarks of the scoring hot paths.
+
+Usage (from the root of the project):
+    python -m bench.bench_scoring --save               # Measures and saves the baseline
+    python -m bench.bench_scoring --check              # Measures and fails if the throughput regressed
+    python -m bench.bench_scoring --check --threshold 0.1
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from bowling.const import NUMBER_OF_PINS
+from bowling.frame import BowlingFrame
+from bowling.game import BowlingGame
+
+__author__ = 'Anthony Rouneau'
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+DEFAULT_THRESHOLD = 0.2
+NB_GAMES = 300
+NB_REPEATS = 5
+
+# A benchmark gives a function preparing a fresh state (not timed), a function running the benchmark on that state
+#  (timed), and the number of operations performed by one run.
+BENCHMARK = Tuple[Callable[[], Any], Callable[[Any], None], int]
+
+
+def randomGame(rng: random.Random) -> List[NUMBER_OF_PINS]:
+    """
+    Returns: The throwing of a random, complete, game
+    """
+    throwing = []
+    for frame_nb in range(1, 11):
+        first = rng.randint(0, 10)
+        throwing.append(first)
+        if frame_nb == 10:
+            second = rng.randint(0, 10) if first == 10 else rng.randint(0, 10 - first)
+            throwing.append(second)
+            if first + second >= 10:
+                throwing.append(rng.randint(0, 10))
+        elif first != 10:
+            throwing.append(rng.randint(0, 10 - first))
+    return throwing
+
+
+def gameMix(nb_games: int = NB_GAMES) -> List[List[NUMBER_OF_PINS]]:
+    """
+    Returns: A realistic mix of games: a few perfect games, a few games of spares, and mostly random games
+    """
+    rng = random.Random(2017)
+    games = []
+    for index in range(nb_games):
+        if index % 10 == 0:
+            games.append([10] * 12)
+        elif index % 10 == 1:
+            games.append([5] * 21)
+        else:
+            games.append(randomGame(rng))
+    return games
+
+
+def buildFrames(throwing_list: List[NUMBER_OF_PINS]) -> List[BowlingFrame]:
+    """
+    Returns: The finished frames of the given game, whose score has not been computed yet
+    """
+    frames = []
+    index = 0
+    while len(frames) != 10:
+        frame = BowlingFrame("bench", ending=len(frames) == 9)
+        while not frame.isFinished:
+            frame.registerThrowing(throwing_list[index])
+            index += 1
+        frames.append(frame)
+    return frames
+
+
+def playGame(throwing_list: List[NUMBER_OF_PINS]) -> BowlingGame:
+    """
+    Returns: A finished single-player game
+    """
+    game = BowlingGame(["bench"])
+    game.play(throwing_list, verbose=False)
+    return game
+
+
+def benchRegisterThrowing(games: List[List[NUMBER_OF_PINS]]) -> BENCHMARK:
+    def run(_):
+        for throwing_list in games:
+            buildFrames(throwing_list)
+    return lambda: None, run, sum(len(throwing_list) for throwing_list in games)
+
+
+def benchFrameComputeScore(games: List[List[NUMBER_OF_PINS]]) -> BENCHMARK:
+    def run(frames_list):
+        for frames in frames_list:
+            for i in range(8):
+                frames[i].computeScore(frames[i + 1], frames[i + 2])
+    return lambda: [buildFrames(throwing_list) for throwing_list in games], run, 8 * len(games)
+
+
+def benchGameComputeScore(games: List[List[NUMBER_OF_PINS]]) -> BENCHMARK:
+    def run(_):
+        for throwing_list in games:
+            BowlingGame.computeScore(throwing_list)
+    return lambda: None, run, len(games)
+
+
+def benchFsmComputeScore(games: List[List[NUMBER_OF_PINS]]) -> BENCHMARK:
+    def run(_):
+        for throwing_list in games:
+            BowlingGame.computeScore(throwing_list, engine='fsm')
+    return lambda: None, run, len(games)
+
+
+def benchComputeScoreOnFrames(games: List[List[NUMBER_OF_PINS]]) -> BENCHMARK:
+    def run(frames_list):
+        for frames in frames_list:
+            BowlingGame.computeScoreOnFrames(frames)
+    return lambda: [buildFrames(throwing_list) for throwing_list in games], run, len(games)
+
+
+def benchRendering(games: List[List[NUMBER_OF_PINS]]) -> BENCHMARK:
+    def run(played_games):
+        for game in played_games:
+            str(game)
+    # The games are played again before each run, so that their renderer has not cached any frame yet
+    return lambda: [playGame(throwing_list) for throwing_list in games], run, len(games)
+
+
+BENCHMARKS = {
+    'BowlingFrame.registerThrowing': benchRegisterThrowing,
+    'BowlingFrame.computeScore': benchFrameComputeScore,
+    'BowlingGame.computeScore': benchGameComputeScore,
+    'BowlingGame.computeScore[fsm]': benchFsmComputeScore,
+    'BowlingGame.computeScoreOnFrames': benchComputeScoreOnFrames,
+    'BowlingGame.__str__': benchRendering,
+}  # type: Dict[str, Callable[[List[List[NUMBER_OF_PINS]]], BENCHMARK]]
+
+
+def measure(nb_repeats: int = NB_REPEATS) -> Dict[str, float]:
+    """
+    Runs all the benchmarks on the same game mix.
+
+    Args:
+        nb_repeats: The number of times each benchmark is run. The best run is kept.
+
+    Returns: The throughput (operations per second) of each benchmark
+    """
+    games = gameMix()
+    results = {}
+    for name, benchmark in BENCHMARKS.items():
+        prepare, run, nb_operations = benchmark(games)
+        best_time = float('inf')
+        for _ in range(nb_repeats):
+            state = prepare()
+            start = time.perf_counter()
+            run(state)
+            best_time = min(best_time, time.perf_counter() - start)
+        results[name] = nb_operations / best_time
+    return results
+
+
+def findRegressions(results: Dict[str, float], baseline: Dict[str, float], threshold: float) -> List[str]:
+    """
+    Args:
+        results: The throughput measured now.
+        baseline: The throughput measured on the baseline.
+        threshold: The tolerated relative loss of throughput (0.2 means 20% slower).
+
+    Returns: The names of the benchmarks whose throughput regressed past the threshold
+    """
+    return [name for name, throughput in results.items()
+            if name in baseline and throughput < baseline[name] * (1 - threshold)]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmarks the scoring hot paths.")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="The file containing the baseline results")
+    parser.add_argument('--save', action='store_true', help="Saves the results as the new baseline")
+    parser.add_argument('--check', action='store_true', help="Fails if the results regressed from the baseline")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="The tolerated relative loss of throughput (default: %(default)s)")
+    parser.add_argument('--repeats', type=int, default=NB_REPEATS, help="The number of runs of each benchmark")
+    args = parser.parse_args()
+
+    measured = measure(args.repeats)
+    baseline_results = {}  # type: Dict[str, float]
+    if args.check:
+        with open(args.baseline) as baseline_file:
+            baseline_results = json.load(baseline_file)
+    for benchmark_name, benchmark_throughput in measured.items():
+        line = "%-35s %12.0f ops/s" % (benchmark_name, benchmark_throughput)
+        if benchmark_name in baseline_results:
+            line += "  (%+.1f%%)" % (100 * (benchmark_throughput / baseline_results[benchmark_name] - 1))
+        print(line)
+    if args.save:
+        with open(args.baseline, 'w') as baseline_file:
+            json.dump(measured, baseline_file, indent=2, sort_keys=True)
+    if args.check:
+        regressions = findRegressions(measured, baseline_results, args.threshold)
+        if len(regressions) != 0:
+            print("Throughput regressed past %d%% for: %s" % (100 * args.threshold, ", ".join(regressions)))
+            sys.exit(1)
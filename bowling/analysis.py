@@ -0,0 +1,137 @@
+from typing import Dict, List, Mapping, Sequence, Tuple, Union
+
+from .const import NUMBER_OF_PINS, PLAYER_SCORE
+
+__author__ = 'Anthony Rouneau'
+
+# Probabilities of knocking down 0, 1, ..., 10 pins, either on a full set of pins (the probabilities of knocking down
+#  more pins than there are standing are then given to knocking down all of them), or for each number of standing pins
+PIN_DISTRIBUTION = Union[Sequence[float], Mapping[int, Sequence[float]]]
+# The number of the frame (11 once the game is over), the throwing already performed in that frame, and the number of
+#  previous frames for which the next throwing and the throwing after that count as a bonus
+GAME_STATE = Tuple[int, Tuple[NUMBER_OF_PINS, ...], int, int]
+
+FIRST_STATE = (1, (), 0, 0)  # type: GAME_STATE
+FINAL_STATE = (11, (), 0, 0)  # type: GAME_STATE
+
+
+def computeScoreDistribution(pin_distribution: PIN_DISTRIBUTION,
+                             throwing_list: Sequence[NUMBER_OF_PINS] = ()) -> Dict[PLAYER_SCORE, float]:
+    """
+    Computes the exact probability distribution of the final score of a game, by dynamic programming over the
+    state of the game (frame, throwing of the frame, pending strike and spare bonuses), instead of enumerating games.
+
+    Args:
+        pin_distribution: The probabilities of knocking down each number of pins in one throwing.
+        throwing_list: The throwing already performed in the game, if the game is in progress.
+
+    Returns: The probability of each final score that can be reached, sorted by score
+
+    Raises:
+        ValueError: If the pin distribution is not a probability distribution, or if the throwing are not valid.
+    """
+    roll_distributions = {}  # type: Dict[int, List[Tuple[NUMBER_OF_PINS, float]]]
+    transitions = {}  # type: Dict[GAME_STATE, List[Tuple[GAME_STATE, int, float]]]
+    state, score = FIRST_STATE, 0
+    for nb_pins in throwing_list:
+        if state == FINAL_STATE:
+            raise ValueError("The game is over, no throwing can follow")
+        if not 0 <= nb_pins <= getStandingPins(state):
+            raise ValueError("Cannot knock down %d pins when %d are standing" % (nb_pins, getStandingPins(state)))
+        state, points = nextState(state, nb_pins)
+        score += points
+
+    final_distribution = {}  # type: Dict[PLAYER_SCORE, float]
+    distribution = {state: {score: 1.0}}  # type: Dict[GAME_STATE, Dict[PLAYER_SCORE, float]]
+    while len(distribution) != 0:
+        # Each iteration performs one more throwing in every game that is not over yet
+        next_distribution = {}  # type: Dict[GAME_STATE, Dict[PLAYER_SCORE, float]]
+        for state, scores in distribution.items():
+            if state == FINAL_STATE:
+                for score, probability in scores.items():
+                    final_distribution[score] = final_distribution.get(score, 0.0) + probability
+                continue
+            if state not in transitions:
+                standing = getStandingPins(state)
+                if standing not in roll_distributions:
+                    roll_distributions[standing] = _rollDistribution(pin_distribution, standing)
+                transitions[state] = [nextState(state, nb_pins) + (probability,)
+                                      for nb_pins, probability in roll_distributions[standing]]
+            for next_state, points, roll_probability in transitions[state]:
+                next_scores = next_distribution.setdefault(next_state, {})
+                for score, probability in scores.items():
+                    next_scores[score + points] = next_scores.get(score + points, 0.0) + probability * roll_probability
+        distribution = next_distribution
+    return {score: final_distribution[score] for score in sorted(final_distribution)}
+
+
+def computeExpectedScore(distribution: Dict[PLAYER_SCORE, float]) -> float:
+    """
+    Args:
+        distribution: A distribution of final scores, as given by computeScoreDistribution.
+
+    Returns: The expected final score
+    """
+    return sum(score * probability for score, probability in distribution.items())
+
+
+def getStandingPins(state: GAME_STATE) -> NUMBER_OF_PINS:
+    """
+    Returns: The number of pins standing before the next throwing of a game in the given state
+    """
+    frame_nb, throwing, _, _ = state
+    if frame_nb != 10 or len(throwing) == 0:
+        return 10 - sum(throwing)
+    if len(throwing) == 1:
+        return 10 if throwing[0] == 10 else 10 - throwing[0]
+    if throwing[0] == 10 and throwing[1] != 10:
+        return 10 - throwing[1]
+    # After two strikes or a spare, the bonus throwing of the ending frame is performed on a new set of pins
+    return 10
+
+
+def nextState(state: GAME_STATE, nb_pins: NUMBER_OF_PINS) -> Tuple[GAME_STATE, int]:
+    """
+    Performs a throwing.
+
+    Args:
+        state: The state of the game before the throwing.
+        nb_pins: The number of pins knocked down by the throwing (at most the number of standing pins).
+
+    Returns: The state of the game after the throwing, and the points brought by the throwing (bonuses included)
+    """
+    frame_nb, throwing, next_bonus, second_next_bonus = state
+    points = nb_pins * (1 + next_bonus)
+    next_bonus, second_next_bonus = second_next_bonus, 0
+    throwing += (nb_pins,)
+    if frame_nb != 10:
+        if throwing == (10,):
+            next_bonus += 1
+            second_next_bonus += 1
+        elif len(throwing) == 2 and sum(throwing) == 10:
+            next_bonus += 1
+        if throwing[0] == 10 or len(throwing) == 2:
+            return (frame_nb + 1, (), next_bonus, second_next_bonus), points
+    elif len(throwing) == 3 or (len(throwing) == 2 and sum(throwing) < 10):
+        return FINAL_STATE, points
+    return (frame_nb, throwing, next_bonus, second_next_bonus), points
+
+
+def _rollDistribution(pin_distribution: PIN_DISTRIBUTION,
+                      standing: NUMBER_OF_PINS) -> List[Tuple[NUMBER_OF_PINS, float]]:
+    """
+    Returns: The probability of knocking down each number of pins when the given number of pins are standing
+    """
+    if isinstance(pin_distribution, Mapping):
+        if standing not in pin_distribution:
+            raise ValueError("No probabilities are given for %d standing pins" % standing)
+        probabilities = list(pin_distribution[standing])
+        if len(probabilities) != standing + 1:
+            raise ValueError("%d probabilities are needed when %d pins are standing" % (standing + 1, standing))
+    else:
+        if len(pin_distribution) != 11:
+            raise ValueError("11 probabilities are needed, from 0 to 10 knocked down pins")
+        probabilities = list(pin_distribution[:standing]) + [sum(pin_distribution[standing:])]
+    if any(probability < 0 for probability in probabilities) or abs(sum(probabilities) - 1) > 1e-9:
+        raise ValueError("The probabilities of knocking down pins must be positive and sum up to 1")
+    return [(nb_pins, probability) for nb_pins, probability in enumerate(probabilities) if probability > 0]
@@ -0,0 +1,201 @@
+"""
+Binary archive of bowling games.
+An archive starts with a header of 16 bytes (little-endian):
+    - the magic number b'BWLA'
+    - the version of the format (1 byte)
+    - the size of a record (1 byte, always 21)
+    - 2 reserved bytes
+    - the number of records (8 bytes)
+It is followed by one record per game: 21 bytes, one byte per throwing, padded with 0xFF.
+"""
+
+import mmap
+import struct
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Sequence, Union
+
+from .batch import computeRowScore
+from .const import NUMBER_OF_PINS, PLAYER_SCORE
+
+__author__ = 'Anthony Rouneau'
+
+MAGIC = b'BWLA'
+VERSION = 1
+RECORD_SIZE = 21
+PADDING = 0xFF
+_HEADER = struct.Struct('<4sBBxxQ')
+
+
+class ArchiveWriter:
+    """
+    Class writing bowling games in a binary archive.
+    """
+
+    def __init__(self, path: str):
+        """
+        Creates a new archive, replacing any existing file at the given path.
+
+        Args:
+            path: The path of the archive to write.
+        """
+        self._file = open(path, 'wb')  # type: BinaryIO
+        self._nbRecords = 0
+        self._file.write(_HEADER.pack(MAGIC, VERSION, RECORD_SIZE, 0))
+
+    def write(self, throwing_list: Sequence[NUMBER_OF_PINS]):
+        """
+        Appends a game at the end of the archive.
+
+        Args:
+            throwing_list: The number of pins knocked down at each throwing of the game.
+
+        Raises:
+            ValueError: If the game contains too much throwing, or a number of pins that cannot be stored on a byte.
+        """
+        if len(throwing_list) > RECORD_SIZE:
+            raise ValueError("A game cannot contain more than %d throwing" % RECORD_SIZE)
+        for nb_pins in throwing_list:
+            if not 0 <= nb_pins < PADDING:
+                raise ValueError("Cannot store %d knocked down pins in an archive" % nb_pins)
+        self._file.write(bytes(throwing_list) + bytes((PADDING,)) * (RECORD_SIZE - len(throwing_list)))
+        self._nbRecords += 1
+
+    def writeAll(self, games: Iterable[Sequence[NUMBER_OF_PINS]]):
+        """
+        Appends several games at the end of the archive.
+
+        Args:
+            games: The games to append, one list of throwing per game.
+        """
+        for throwing_list in games:
+            self.write(throwing_list)
+
+    def close(self):
+        """
+        Writes the number of records in the header and closes the archive.
+        """
+        if not self._file.closed:
+            self._file.seek(0)
+            self._file.write(_HEADER.pack(MAGIC, VERSION, RECORD_SIZE, self._nbRecords))
+            self._file.close()
+
+    def __enter__(self) -> 'ArchiveWriter':
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+class ArchiveReader:
+    """
+    Class reading a binary archive of bowling games through a memory map.
+    The records are never copied: they are read and scored straight from the mapped file.
+    """
+
+    def __init__(self, path: str):
+        """
+        Opens an existing archive.
+
+        Args:
+            path: The path of the archive to read.
+
+        Raises:
+            ValueError: If the file is not a valid archive.
+        """
+        with open(path, 'rb') as archive_file:
+            self._map = mmap.mmap(archive_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        self._closed = False
+        if len(self._map) < _HEADER.size:
+            self.close()
+            raise ValueError("%s is too short to be a bowling archive" % path)
+        magic, version, record_size, nb_records = _HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION or record_size != RECORD_SIZE:
+            self.close()
+            raise ValueError("%s is not a bowling archive of version %d" % (path, VERSION))
+        if len(self._map) < _HEADER.size + nb_records * RECORD_SIZE:
+            self.close()
+            raise ValueError("%s is truncated" % path)
+        self._nbRecords = nb_records
+
+    def __len__(self) -> int:
+        return self._nbRecords
+
+    def __getitem__(self, index: int) -> memoryview:
+        """
+        Args:
+            index: The index of the game in the archive.
+
+        Returns: A view on the record of the game, padded with PADDING (the record is not copied).
+                 The file stays mapped as long as the view is not released (e.g. with a with statement).
+        """
+        if index < 0:
+            index += self._nbRecords
+        if not 0 <= index < self._nbRecords:
+            raise IndexError("There are only %d games in this archive" % self._nbRecords)
+        start = _HEADER.size + index * RECORD_SIZE
+        return self._view[start:start + RECORD_SIZE]
+
+    def __iter__(self) -> Iterator[memoryview]:
+        for index in range(self._nbRecords):
+            yield self[index]
+
+    def getThrowing(self, index: int) -> List[NUMBER_OF_PINS]:
+        """
+        Args:
+            index: The index of the game in the archive.
+
+        Returns: The list of the number of pins knocked down at each throwing of the game
+        """
+        with self[index] as record:
+            return [nb_pins for nb_pins in record if nb_pins != PADDING]
+
+    def computeScore(self, index: int) -> Union[PLAYER_SCORE, None]:
+        """
+        Computes the score of one game of the archive, straight from the mapped record.
+
+        Args:
+            index: The index of the game in the archive.
+
+        Returns: The score obtained by the game (None if the score cannot be defined yet)
+        """
+        with self[index] as record:
+            return computeRowScore(record, PADDING)
+
+    def computeScores(self, start: int = 0, stop: Optional[int] = None) -> List[Union[PLAYER_SCORE, None]]:
+        """
+        Computes the score of a range of games of the archive, straight from the mapped records.
+        The bounds are interpreted as the bounds of a slice: they can be negative, and are clamped to the archive.
+
+        Args:
+            start: The index of the first game to score.
+            stop: The index after the last game to score (None to score until the end of the archive).
+
+        Returns: The list of the scores of the games, in the order of the archive
+        """
+        start, stop, _ = slice(start, stop).indices(self._nbRecords)
+        view = self._view
+        scores = []  # type: List[Union[PLAYER_SCORE, None]]
+        for offset in range(_HEADER.size + start * RECORD_SIZE, _HEADER.size + stop * RECORD_SIZE, RECORD_SIZE):
+            with view[offset:offset + RECORD_SIZE] as record:
+                scores.append(computeRowScore(record, PADDING))
+        return scores
+
+    def close(self):
+        """
+        Closes the archive. The records obtained from this archive must not be used anymore.
+        """
+        if not self._closed:
+            self._closed = True
+            self._view.release()
+            try:
+                self._map.close()
+            except BufferError:
+                # Some records obtained through __getitem__ or __iter__ are still referenced: the file is unmapped
+                #  once the last of them is released
+                pass
+
+    def __enter__(self) -> 'ArchiveReader':
+        return self
+
+    def __exit__(self, *_):
+        self.close()
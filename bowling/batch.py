@@ -0,0 +1,101 @@
+from typing import List, Optional, Sequence, Union
+
+from .const import NUMBER_OF_PINS, PLAYER_SCORE
+from .frame import PinsOverflowError
+
+__author__ = 'Anthony Rouneau'
+
+
+def computeScores(games: Sequence[Sequence[NUMBER_OF_PINS]],
+                  padding: Optional[NUMBER_OF_PINS] = None) -> List[Union[PLAYER_SCORE, None]]:
+    """
+    Computes the score of many bowling games at once.
+    Each game is given as one row of throwing (typically padded up to 21 throwing), and is scored with the same
+    rules as BowlingGame.computeScore, without building any BowlingFrame.
+
+    Args:
+        games: A 2-D sequence (list of lists, array rows, ...) containing one row of throwing per game.
+        padding: The value used to pad the rows, if any. A row ends at its first padding value.
+
+    Returns: The list of the scores of the given games, in the same order (None if a score cannot be defined yet)
+
+    Raises:
+        ValueError: If a row contains a negative number of pins or leaves a frame uncompleted.
+        PinsOverflowError: If more than 10 pins have been knocked down in one of the nine first frames.
+    """
+    return [computeRowScore(row, padding) for row in games]
+
+
+def computeRowScore(throwing_list: Sequence[NUMBER_OF_PINS],
+                    padding: Optional[NUMBER_OF_PINS] = None) -> Union[PLAYER_SCORE, None]:
+    """
+    Computes the score of one bowling game in a single pass over its throwing.
+    Gives the same results as BowlingGame.computeScore.
+
+    Args:
+        throwing_list: The number of pins knocked down at each throwing.
+        padding: The value used to pad the row, if any. The row ends at its first padding value.
+
+    Returns: The score obtained for the given throwing, None if the score cannot be defined yet
+    """
+    length = len(throwing_list)
+    if padding is not None:
+        for index in range(length):
+            if throwing_list[index] == padding:
+                length = index
+                break
+    score = 0
+    index = 0
+    frame_nb = 0
+    pending = False
+    while frame_nb != 10 and index != length:
+        frame_nb += 1
+        first = throwing_list[index]
+        if first < 0:
+            raise ValueError("Cannot knock down a negative number of pins")
+        if frame_nb != 10 and first >= 10:
+            if first > 10:
+                raise PinsOverflowError("There are only 10 pins and player has, supposedly, knocked down %d pins"
+                                        % first)
+            # Strike: the two next throwing are added as a bonus, if they are already known
+            score += 10
+            if index + 2 < length:
+                score += throwing_list[index + 1] + throwing_list[index + 2]
+            pending = True
+            index += 1
+            continue
+        if index + 1 >= length:
+            raise ValueError("Not enough pins have been knocked down to finish the frame %d" % frame_nb)
+        second = throwing_list[index + 1]
+        if second < 0:
+            raise ValueError("Cannot knock down a negative number of pins")
+        total_nb_pins = first + second
+        if frame_nb == 10:
+            if total_nb_pins >= 10:
+                # The ending frame grants a third throwing after a strike or a spare
+                if index + 2 >= length:
+                    raise ValueError("Not enough pins have been knocked down to finish the frame %d" % frame_nb)
+                third = throwing_list[index + 2]
+                if third < 0:
+                    raise ValueError("Cannot knock down a negative number of pins")
+                total_nb_pins += third
+                index += 1
+            score += total_nb_pins
+            pending = False
+        elif total_nb_pins > 10:
+            raise PinsOverflowError("There are only 10 pins and player has, supposedly, knocked down %d pins"
+                                    % total_nb_pins)
+        elif total_nb_pins == 10:
+            # Spare: the next throwing is added as a bonus, if it is already known
+            score += 10
+            if index + 2 < length:
+                score += throwing_list[index + 2]
+            pending = True
+        else:
+            score += total_nb_pins
+            pending = False
+        index += 2
+    if pending:
+        # The last frame is a strike or a spare that still waits for its bonus
+        return None
+    return score
@@ -0,0 +1,106 @@
+"""
+Thin blocking client of the scoring daemon (a ScoringServer listening on a Unix socket).
+This module only depends on the standard library, so that scripts using it do not pay for importing the scoring code.
+"""
+
+import json
+import os
+import socket
+import tempfile
+from typing import List, Union
+
+__author__ = 'Anthony Rouneau'
+
+
+def _defaultSocketPath() -> str:
+    """
+    Returns: The path of the Unix socket of the scoring daemon of the current user: BOWLING_DAEMON_SOCKET if it is set,
+             else a socket in the runtime directory of the user, else a socket named after the uid of the user
+             in the temporary directory
+    """
+    if 'BOWLING_DAEMON_SOCKET' in os.environ:
+        return os.environ['BOWLING_DAEMON_SOCKET']
+    runtime_directory = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_directory:
+        return os.path.join(runtime_directory, 'bowling-daemon.sock')
+    return os.path.join(tempfile.gettempdir(), 'bowling-daemon-%d.sock' % os.getuid())
+
+
+DEFAULT_SOCKET_PATH = _defaultSocketPath()
+
+
+class DaemonClient:
+    """
+    Class defining a blocking client of the scoring daemon. The connection is kept open between the requests.
+    """
+
+    def __init__(self, path: str = DEFAULT_SOCKET_PATH, timeout: float = 5.0):
+        """
+        Connects to the scoring daemon. Only the sockets of the current user are trusted, so that another user
+        cannot answer with fake scores.
+
+        Args:
+            path: The path of the Unix socket of the daemon.
+            timeout: The maximum time (in seconds) to wait for the daemon.
+
+        Raises:
+            OSError: If the daemon is not available.
+            PermissionError: If the socket belongs to another user.
+        """
+        if os.stat(path).st_uid != os.getuid():
+            raise PermissionError("The socket %s belongs to another user" % path)
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self._socket.settimeout(timeout)
+            self._socket.connect(path)
+        except OSError:
+            self._socket.close()
+            raise
+        self._file = self._socket.makefile('rwb')
+
+    def computeScore(self, throwing_list: List[int]) -> Union[int, None]:
+        """
+        Computes the score of a Bowling game on the daemon, as BowlingGame.computeScore would.
+
+        Args:
+            throwing_list: The list containing the number of pins knocked down at each throwing.
+
+        Returns: The score obtained for the given list of throwing (None if it cannot be defined yet)
+
+        Raises:
+            ValueError: If the daemon could not compute the score.
+            ConnectionError: If the daemon closed the connection.
+        """
+        self._file.write(json.dumps({'op': 'score', 'throwing': throwing_list}).encode() + b'\n')
+        self._file.flush()
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("The scoring daemon closed the connection")
+        response = json.loads(line.decode())
+        if not response['ok']:
+            raise ValueError(response['error'])
+        return response['score']
+
+    def close(self):
+        """
+        Closes the connection to the daemon.
+        """
+        self._file.close()
+        self._socket.close()
+
+    def __enter__(self) -> 'DaemonClient':
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+def isDaemonAvailable(path: str = DEFAULT_SOCKET_PATH) -> bool:
+    """
+    Returns: True if a scoring daemon is listening on the given Unix socket
+    """
+    try:
+        DaemonClient(path, timeout=0.5).close()
+        return True
+    except OSError:
+        return False
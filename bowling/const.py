@@ -1,3 +1,4 @@
 PLAYER_NAME = str
 PLAYER_SCORE = int
 NUMBER_OF_PINS = int
+DEFAULT_CHUNK_SIZE = 10000  # The number of games sent at once to a process scoring in parallel
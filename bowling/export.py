@@ -0,0 +1,199 @@
+"""
+Columnar export of the frames of many games, in the NumPy .npz format: a zip archive containing one .npy file per
+column, readable with numpy.load without any conversion. Each row describes one frame of one player:
+    - player: the index of the player in the 'players' column (which holds one name per player)
+    - game_id: the identifier of the game
+    - frame: the number of the frame, in [1, 10]
+    - roll1, roll2, roll3: the number of pins knocked down at each throwing of the frame (-1 if not performed)
+    - score: the accumulated score at the end of the frame (-1 if it cannot be computed yet)
+    - strike, spare, open: the kind of the frame
+"""
+
+import ast
+import struct
+import sys
+import tempfile
+import zipfile
+from array import array
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+from .const import PLAYER_NAME
+from .game import BowlingGame
+
+__author__ = 'Anthony Rouneau'
+
+# Name and array type code of each column of frames
+COLUMNS = [
+    ('player', 'i'),
+    ('game_id', 'q'),
+    ('frame', 'b'),
+    ('roll1', 'h'),
+    ('roll2', 'h'),
+    ('roll3', 'h'),
+    ('score', 'i'),
+    ('strike', 'B'),
+    ('spare', 'B'),
+    ('open', 'B'),
+]  # type: List[Tuple[str, str]]
+BOOLEAN_COLUMNS = ('strike', 'spare', 'open')
+DEFAULT_CHUNK_SIZE = 65536
+NPY_MAGIC = b'\x93NUMPY\x01\x00'
+_BYTE_ORDER = '<' if sys.byteorder == 'little' else '>'
+_COPY_SIZE = 1 << 20
+
+
+def _getDescription(name: str, type_code: str) -> str:
+    """
+    Returns: The NumPy description of the type of the values of a column
+    """
+    if name in BOOLEAN_COLUMNS:
+        return '|b1'
+    return '%si%d' % (_BYTE_ORDER, array(type_code).itemsize)
+
+
+def _npyHeader(description: str, length: int) -> bytes:
+    """
+    Returns: The header of a .npy file containing a 1-D array of the given type and length
+    """
+    header = "{'descr': '%s', 'fortran_order': False, 'shape': (%d,), }" % (description, length)
+    # The header is padded with spaces so that the data starts on a multiple of 64 bytes
+    padding = 63 - (len(NPY_MAGIC) + 2 + len(header)) % 64
+    header += ' ' * padding + '\n'
+    return NPY_MAGIC + struct.pack('<H', len(header)) + header.encode('latin1')
+
+
+class ColumnarExporter:
+    """
+    Class writing the frames of many games in a columnar .npz file.
+    The rows are buffered in chunks, each chunk being appended to one temporary file per column, so that the memory
+    used does not depend on the number of exported games. The .npz file is assembled when the exporter is closed.
+    """
+
+    def __init__(self, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Creates a new exporter, replacing any existing file at the given path once closed.
+
+        Args:
+            path: The path of the .npz file to write.
+            chunk_size: The number of rows buffered in memory before being written to the temporary files.
+        """
+        if chunk_size < 1:
+            raise ValueError("The chunks must contain at least one row")
+        self.path = path
+        self.chunkSize = chunk_size
+        self.nbRows = 0
+        self.closed = False
+        self._nbGames = 0
+        self._players = {}  # type: Dict[PLAYER_NAME, int]
+        self._chunks = {name: array(type_code) for name, type_code in COLUMNS}  # type: Dict[str, array]
+        self._files = {name: tempfile.TemporaryFile() for name, _ in COLUMNS}  # type: Dict[str, BinaryIO]
+
+    def addGame(self, game: BowlingGame, game_id: Optional[int] = None):
+        """
+        Adds one row per frame of each player of the given game, finished or not.
+
+        Args:
+            game: The game to export.
+            game_id: The identifier of the game (by default, the number of games added before this one).
+        """
+        if self.closed:
+            raise ValueError("The exporter is closed")
+        if game_id is None:
+            game_id = self._nbGames
+        self._nbGames += 1
+        chunks = self._chunks
+        players, game_ids, frame_nbs = chunks['player'], chunks['game_id'], chunks['frame']
+        rolls1, rolls2, rolls3, scores = chunks['roll1'], chunks['roll2'], chunks['roll3'], chunks['score']
+        strikes, spares, opens = chunks['strike'], chunks['spare'], chunks['open']
+        for player in game.players:
+            code = self._players.setdefault(player, len(self._players))
+            for index, frame in enumerate(game.frames[player]):
+                throwing = frame.getThrowing() + (-1, -1, -1)
+                score = frame.getScore()
+                players.append(code)
+                game_ids.append(game_id)
+                frame_nbs.append(index + 1)
+                rolls1.append(throwing[0])
+                rolls2.append(throwing[1])
+                rolls3.append(throwing[2])
+                scores.append(-1 if score is None else score)
+                strikes.append(frame.isStrike())
+                spares.append(frame.isSpare())
+                opens.append(frame.isHole())
+        if len(players) >= self.chunkSize:
+            self._flush()
+
+    def _flush(self):
+        """
+        Appends the buffered rows to the temporary files, and empties the buffers.
+        """
+        nb_rows = len(self._chunks['player'])
+        for name, type_code in COLUMNS:
+            self._chunks[name].tofile(self._files[name])
+            self._chunks[name] = array(type_code)
+        self.nbRows += nb_rows
+
+    def close(self):
+        """
+        Writes the .npz file from the temporary files, and removes them.
+        """
+        if self.closed:
+            return
+        self._flush()
+        self.closed = True
+        with zipfile.ZipFile(self.path, 'w', zipfile.ZIP_STORED, allowZip64=True) as npz_file:
+            for name, type_code in COLUMNS:
+                column_file = self._files[name]
+                column_file.seek(0)
+                with npz_file.open(name + '.npy', 'w', force_zip64=True) as npy_file:
+                    npy_file.write(_npyHeader(_getDescription(name, type_code), self.nbRows))
+                    data = column_file.read(_COPY_SIZE)
+                    while len(data) != 0:
+                        npy_file.write(data)
+                        data = column_file.read(_COPY_SIZE)
+                column_file.close()
+            names = list(self._players)
+            width = max([len(player) for player in names] + [1])
+            with npz_file.open('players.npy', 'w') as npy_file:
+                npy_file.write(_npyHeader('<U%d' % width, len(names)))
+                npy_file.write(b''.join(player.ljust(width, '\0').encode('utf-32-le') for player in names))
+
+    def __enter__(self) -> 'ColumnarExporter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def readColumns(path: str) -> Dict[str, list]:
+    """
+    Reads a .npz file written by ColumnarExporter without NumPy.
+
+    Args:
+        path: The path of the .npz file.
+
+    Returns: The values of each column, as lists
+    """
+    columns = {}  # type: Dict[str, list]
+    with zipfile.ZipFile(path) as npz_file:
+        for entry in npz_file.namelist():
+            data = npz_file.read(entry)
+            if not data.startswith(NPY_MAGIC):
+                raise ValueError("%s is not a .npy file written by the exporter" % entry)
+            header_length = struct.unpack('<H', data[8:10])[0]
+            header = ast.literal_eval(data[10:10 + header_length].decode('latin1'))
+            data = data[10 + header_length:]
+            description = header['descr']
+            if description.startswith('<U'):
+                width = int(description[2:])
+                values = [data[index:index + 4 * width].decode('utf-32-le').rstrip('\0')
+                          for index in range(0, len(data), 4 * width)]
+            else:
+                type_code = dict(COLUMNS)[entry[:-len('.npy')]]
+                values = array(type_code)
+                values.frombytes(data)
+                if description[0] not in ('|', _BYTE_ORDER):
+                    values.byteswap()
+                values = [bool(value) for value in values] if description == '|b1' else values.tolist()
+            columns[entry[:-len('.npy')]] = values
+    return columns
@@ -1,4 +1,4 @@
-from typing import Tuple, Optional, Union
+from typing import Callable, Tuple, Optional, Union
 
 from .const import PLAYER_NAME, NUMBER_OF_PINS
 
@@ -11,6 +11,9 @@ class BowlingFrame:
     There are 10 frames per player in a bowling game.
     """
 
+    __slots__ = ('player', 'isFinished', 'ending', '_score', '_firstThrowing', '_secondThrowing', '_thirdThrowing',
+                 '_knockedDownPins', '_previousScore', '_resolver')
+
     def __init__(self, player: PLAYER_NAME, ending: bool = False):
         """
         Creates a new Bowling frame for the given player.
@@ -23,13 +26,22 @@ class BowlingFrame:
         self.isFinished = False
         self.ending = ending
         self._score = None
-        self._throwing = ()  # type: Tuple[NUMBER_OF_PINS, ...]
+        # The throwing are kept in fixed fields (None until performed) rather than in a tuple growing with each throwing
+        self._firstThrowing = None  # type: Optional[NUMBER_OF_PINS]
+        self._secondThrowing = None  # type: Optional[NUMBER_OF_PINS]
+        self._thirdThrowing = None  # type: Optional[NUMBER_OF_PINS]
+        # Running total of the pins knocked down in this frame
+        self._knockedDownPins = 0  # type: NUMBER_OF_PINS
         self._previousScore = 0
+        # Called before reading the score, to compute it if it is evaluated lazily (see BowlingGame)
+        self._resolver = None  # type: Optional[Callable[[], None]]
 
     def getScore(self) -> Union[int, None]:
         """
         Returns: None if the score cannot be computed yet. Else, returns the accumulated score.
         """
+        if self._resolver is not None:
+            self._resolver()
         if self._score is None:
             return None
         return self._previousScore + self._score
@@ -43,29 +55,46 @@ class BowlingFrame:
         """
         self._previousScore = previous_score
 
+    def resetScore(self):
+        """
+        Forgets the score of this frame, so that it is computed again by the next call to computeScore.
+        """
+        if self.isFinished and (self.isHole() or self.ending):
+            # The score of the frame only depends on its own throwing
+            self._score = self.getNbOfKnockedDownPins()
+        else:
+            self._score = None
+
     def isStrike(self) -> bool:
         """
         Returns: True if the player has performed a strike during this frame.
         """
-        return len(self._throwing) >= 1 and self.getNbOfKnockedDownPins(1) == 10
+        return self._firstThrowing == 10
 
     def isSpare(self) -> bool:
         """
         Returns: True if the player has performed a spare during this frame.
         """
-        return not self.isStrike() and self.getNbOfKnockedDownPins(2) == 10
+        second_throwing = self._secondThrowing
+        return second_throwing is not None and self._firstThrowing != 10 and self._firstThrowing + second_throwing == 10
 
     def isHole(self) -> bool:
         """
         Returns: True if the player has neither performed a strike or a spare.
         """
-        return self.isFinished and self.getNbOfKnockedDownPins() < 10
+        return self.isFinished and self._knockedDownPins < 10
 
     def getThrowing(self) -> Tuple[NUMBER_OF_PINS, ...]:
         """
         Returns: The results of this frame.
         """
-        return self._throwing
+        if self._firstThrowing is None:
+            return ()
+        if self._secondThrowing is None:
+            return self._firstThrowing,
+        if self._thirdThrowing is None:
+            return self._firstThrowing, self._secondThrowing
+        return self._firstThrowing, self._secondThrowing, self._thirdThrowing
 
     def getNbOfKnockedDownPins(self, max_size: int = -1) -> NUMBER_OF_PINS:
         """
@@ -74,9 +103,15 @@ class BowlingFrame:
             
         Returns: The number of pins knocked down until now.
         """
-        if max_size == -1:
-            max_size = len(self._throwing)
-        return sum(self._throwing[:max_size])
+        if max_size == -1 or max_size >= 3:
+            return self._knockedDownPins
+        if max_size < 0:
+            return sum(self.getThrowing()[:max_size])
+        if max_size == 0 or self._firstThrowing is None:
+            return 0
+        if max_size == 1 or self._secondThrowing is None:
+            return self._firstThrowing
+        return self._firstThrowing + self._secondThrowing
 
     def registerThrowing(self, nb_pins: NUMBER_OF_PINS):
         """
@@ -88,20 +123,58 @@ class BowlingFrame:
         if not self.isFinished:
             if nb_pins < 0:
                 raise ValueError("Cannot knock down a negative number of pins")
-            self._throwing += (nb_pins,)
-            throwing = self._throwing
-
-            total_nb_pins = self.getNbOfKnockedDownPins()
+            total_nb_pins = self._knockedDownPins + nb_pins
             if total_nb_pins > 10 and not self.ending:
-                self._throwing = throwing[:-1]  # Cancels the last throwing.
                 raise PinsOverflowError("There are only 10 pins and %s has, supposedly, knocked down %d pins"
                                         % (self.player, total_nb_pins))
+            if self._firstThrowing is None:
+                self._firstThrowing = nb_pins
+                nb_throwing = 1
+            elif self._secondThrowing is None:
+                self._secondThrowing = nb_pins
+                nb_throwing = 2
+            else:
+                self._thirdThrowing = nb_pins
+                nb_throwing = 3
+            self._knockedDownPins = total_nb_pins
 
-            if len(throwing) == 3 or (len(throwing) == 2 and (not self.ending or total_nb_pins < 10)) \
+            if nb_throwing == 3 or (nb_throwing == 2 and (not self.ending or total_nb_pins < 10)) \
                     or (not self.ending and self.isStrike()):
                 self.isFinished = True
                 self.computeScore()
 
+    def replaceThrowing(self, index: int, nb_pins: NUMBER_OF_PINS):
+        """
+        Corrects the result of a throwing already registered. The score of this frame is reset, and must be
+        computed again with the next frames if needed.
+
+        Args:
+            index: The index of the throwing in this frame.
+            nb_pins: The number of pins that actually fell during this throwing.
+
+        Raises:
+            ValueError: If there is no such throwing, if the number of pins is negative, or if the correction
+                        changes the number of throwing of this frame.
+            PinsOverflowError: If too much pins seem to have been knocked down in this frame after the correction.
+        """
+        throwing = self.getThrowing()
+        if not 0 <= index < len(throwing):
+            raise ValueError("There is no throwing %d in this frame" % index)
+        # The corrected throwing are replayed in a new frame to validate them
+        corrected_frame = BowlingFrame(self.player, self.ending)
+        corrected_throwing = throwing[:index] + (nb_pins,) + throwing[index + 1:]
+        for corrected_nb_pins in corrected_throwing:
+            if corrected_frame.isFinished:
+                raise ValueError("This correction would finish the frame before its last throwing")
+            corrected_frame.registerThrowing(corrected_nb_pins)
+        if corrected_frame.isFinished != self.isFinished:
+            raise ValueError("This correction would leave the frame waiting for another throwing")
+        self._firstThrowing = corrected_frame._firstThrowing
+        self._secondThrowing = corrected_frame._secondThrowing
+        self._thirdThrowing = corrected_frame._thirdThrowing
+        self._knockedDownPins = corrected_frame._knockedDownPins
+        self.resetScore()
+
     def computeScore(self, next_frame: Optional['BowlingFrame'] = None,
                      next_next_frame: Optional['BowlingFrame'] = None):
         """
@@ -120,19 +193,19 @@ class BowlingFrame:
 
             else:
                 if self.isSpare():
-                    self._score = total_nb_pins + next_frame._throwing[0]
+                    self._score = total_nb_pins + next_frame._firstThrowing
 
-                elif self.isStrike() and (next_frame.isFinished or len(next_frame.getThrowing()) >= 2):
+                elif self.isStrike() and (next_frame.isFinished or next_frame._secondThrowing is not None):
                     # A strike occurred in this frame, hence, the points must be accumulated with the next frame
                     #  and with the first throwing of the frame after that if the direct next frame has also a strike.
                     potential_score = total_nb_pins + next_frame.getNbOfKnockedDownPins(2)
                     if next_frame.isHole() or next_frame.isSpare() or next_frame.ending:
                         # The next frame is not a strike, so we can stop accumulating points
                         self._score = potential_score
-                    elif next_next_frame is not None and len(next_next_frame.getThrowing()) >= 1:
+                    elif next_next_frame is not None and next_next_frame._firstThrowing is not None:
                         # The next frame is a strike and the frame after that can be used
                         self._score = potential_score + next_next_frame.getNbOfKnockedDownPins(1)
-        if self.getScore() is not None and next_frame is not None:
+        if next_frame is not None and self.getScore() is not None:
             # We can propagate the score of this frame to the next one once it is set.
             next_frame.setPreviousScore(self.getScore())
 
@@ -142,6 +215,19 @@ class BowlingFrame:
         """
         return self._score is None
 
+    def getNbOfBonusThrowing(self) -> int:
+        """
+        Returns: The number of throwing that follow this frame and count as a bonus in its score
+                 (2 for a strike, 1 for a spare, 0 otherwise)
+        """
+        if self.ending:
+            return 0
+        if self.isStrike():
+            return 2
+        if self.isSpare():
+            return 1
+        return 0
+
     def __str__(self, score: bool = False) -> str:
         """
         Gives a string representation of this frame.
@@ -162,24 +248,31 @@ class BowlingFrame:
                 score_str += (score_len - len(score_str) - 1) * ' '
                 score_str += '|'
             return score_str
-        else:
-            throwing_1 = self._throwing[0] if len(self._throwing) >= 1 else ' '
-            throwing_2 = self._throwing[1] if len(self._throwing) >= 2 else ' '
-            if self.isStrike():
-                throwing_1 = ' ' if not self.ending else 'X'
-                if not self.ending or self.getNbOfKnockedDownPins(2) >= 20:
-                    throwing_2 = 'X'
-            if self.isSpare():
-                throwing_2 = '/'
-            throwing = "| |%s|%s|" % (throwing_1, throwing_2)
-            if self.ending:
-                throwing_3 = self._throwing[2] if len(self._throwing) >= 3 else ' '
-                if throwing_3 == 10:
-                    throwing_3 = 'X'
-                elif not isinstance(throwing_2, str) and throwing_3 != ' ' and (throwing_2 + throwing_3) == 10:
-                    throwing_3 = '/'
-                throwing += '%s|' % throwing_3
-            return throwing
+        return "| |%s|" % "|".join(self.getMarks())
+
+    def getMarks(self) -> Tuple[str, ...]:
+        """
+        Gives the marks displayed for the throwing of this frame: the number of knocked down pins, 'X' for a strike,
+        '/' for a spare, and ' ' for a throwing that has not been performed yet.
+
+        Returns: The marks of the two throwing of the frame (three for the ending frame)
+        """
+        throwing_1 = self._firstThrowing if self._firstThrowing is not None else ' '
+        throwing_2 = self._secondThrowing if self._secondThrowing is not None else ' '
+        if self.isStrike():
+            throwing_1 = ' ' if not self.ending else 'X'
+            if not self.ending or self.getNbOfKnockedDownPins(2) >= 20:
+                throwing_2 = 'X'
+        if self.isSpare():
+            throwing_2 = '/'
+        if not self.ending:
+            return str(throwing_1), str(throwing_2)
+        throwing_3 = self._thirdThrowing if self._thirdThrowing is not None else ' '
+        if throwing_3 == 10:
+            throwing_3 = 'X'
+        elif not isinstance(throwing_2, str) and throwing_3 != ' ' and (throwing_2 + throwing_3) == 10:
+            throwing_3 = '/'
+        return str(throwing_1), str(throwing_2), str(throwing_3)
 
 
 class PinsOverflowError(Exception):
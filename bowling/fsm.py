@@ -0,0 +1,121 @@
+"""
+Table-driven scoring of bowling games.
+A game is modelled as a finite-state machine whose state is the frame number, the throwing in the frame, the pins
+knocked down by the first throwing of the frame, and the number of previous frames for which the next two throwing
+count as a bonus. The transitions and the weight of the throwing in each state are computed once, so that scoring
+a throwing is a table lookup and an addition.
+The rules are the ones of BowlingGame.computeScore: more than 10 pins in one of the nine first frames is a
+PinsOverflowError, and the ending frame grants a third throwing whenever its two first throwing knock down
+10 pins or more, without any overflow check.
+"""
+
+from typing import Dict, List, Sequence, Tuple, Union
+
+from .const import NUMBER_OF_PINS, PLAYER_SCORE
+from .frame import PinsOverflowError
+
+__author__ = 'Anthony Rouneau'
+
+# Frame number, index of the throwing in the frame, pins knocked down by the first throwing of the frame,
+#  number of frames for which the next throwing is a bonus, and for which the throwing after that is a bonus
+FSM_STATE = Tuple[int, int, NUMBER_OF_PINS, int, int]
+
+FIRST_STATE = (1, 0, 0, 0, 0)  # type: FSM_STATE
+FINAL_STATE = (11, 0, 0, 0, 0)  # type: FSM_STATE
+NB_COLUMNS = 12  # One column per number of knocked down pins, the last one for more than 10 pins
+OVERFLOW = -1  # Transition of a throwing knocking down too much pins
+
+
+def _nextState(state: FSM_STATE, nb_pins: NUMBER_OF_PINS) -> Union[FSM_STATE, None]:
+    """
+    Returns: The state reached by knocking down the given number of pins (11 meaning more than 10),
+             or None if this is too much pins
+    """
+    frame_nb, throwing_index, first, next_bonus, second_next_bonus = state
+    if frame_nb == 10:
+        nb_pins = min(nb_pins, 10)
+        if throwing_index == 0:
+            return 10, 1, nb_pins, second_next_bonus, 0
+        if throwing_index == 1 and first + nb_pins >= 10:
+            return 10, 2, 0, 0, 0
+        return FINAL_STATE
+    if first + nb_pins > 10:
+        return None
+    if throwing_index == 0 and nb_pins == 10:
+        return frame_nb + 1, 0, 0, second_next_bonus + 1, 1
+    if throwing_index == 0:
+        return frame_nb, 1, nb_pins, second_next_bonus, 0
+    return frame_nb + 1, 0, 0, second_next_bonus + (first + nb_pins == 10), 0
+
+
+def _buildTables() -> Tuple[List[FSM_STATE], List[int], List[int]]:
+    """
+    Enumerates the states reachable from the first one.
+
+    Returns: The states, the transitions (state index * NB_COLUMNS + column -> state index, or OVERFLOW)
+             and the weight of a knocked down pin in each state
+    """
+    states = [FIRST_STATE, FINAL_STATE]
+    indexes = {FIRST_STATE: 0, FINAL_STATE: 1}  # type: Dict[FSM_STATE, int]
+    transitions = []  # type: List[int]
+    weights = []  # type: List[int]
+    index = 0
+    while index != len(states):
+        state = states[index]
+        weights.append(1 + state[3])
+        for nb_pins in range(NB_COLUMNS):
+            next_state = None if state == FINAL_STATE else _nextState(state, nb_pins)
+            if next_state is None:
+                transitions.append(OVERFLOW)
+                continue
+            if next_state not in indexes:
+                indexes[next_state] = len(states)
+                states.append(next_state)
+            transitions.append(indexes[next_state])
+        index += 1
+    return states, transitions, weights
+
+
+STATES, TRANSITIONS, WEIGHTS = _buildTables()
+_FINAL_INDEX = STATES.index(FINAL_STATE)
+# The score of a game stopping in a state is undefined if a throwing is missing in the frame, or if a strike
+#  or a spare still waits for its bonus
+_IN_FRAME = [state[1] != 0 for state in STATES]
+_WAITING = [state[1] == 0 and state[3] != 0 for state in STATES]
+
+
+def computeScore(throwing_list: Sequence[NUMBER_OF_PINS]) -> Union[PLAYER_SCORE, None]:
+    """
+    Computes the score of a bowling game with the finite-state machine. Gives the same results and raises the same
+    errors as BowlingGame.computeScore.
+
+    Args:
+        throwing_list: The number of pins knocked down at each throwing.
+
+    Returns: The score obtained for the given throwing, None if the score cannot be defined yet
+
+    Raises:
+        ValueError: If a throwing knocks down a negative number of pins, or if the throwing leave a frame uncompleted.
+        PinsOverflowError: If more than 10 pins have been knocked down in one of the nine first frames.
+    """
+    transitions = TRANSITIONS
+    weights = WEIGHTS
+    final_index = _FINAL_INDEX
+    state = 0
+    score = 0
+    for nb_pins in throwing_list:
+        if state == final_index:
+            break
+        if nb_pins < 0:
+            raise ValueError("Cannot knock down a negative number of pins")
+        next_state = transitions[state * NB_COLUMNS + (nb_pins if nb_pins <= 10 else 11)]
+        if next_state == OVERFLOW:
+            raise PinsOverflowError("There are only 10 pins and player has, supposedly, knocked down %d pins"
+                                    % (STATES[state][2] + nb_pins))
+        score += nb_pins * weights[state]
+        state = next_state
+    if _IN_FRAME[state]:
+        raise ValueError("Not enough pins have been knocked down to finish the frame %d" % STATES[state][0])
+    if _WAITING[state]:
+        return None
+    return score
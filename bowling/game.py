@@ -1,7 +1,11 @@
-from typing import List, Dict, Union, Optional
+import functools
+from typing import List, Dict, Union, Optional, Sequence, Tuple
 
+from . import fsm
+from .batch import computeScores
 from .const import NUMBER_OF_PINS, PLAYER_NAME, PLAYER_SCORE
 from .frame import BowlingFrame, PinsOverflowError
+from .render import ScoreboardRenderer
 
 __author__ = 'Anthony Rouneau'
 
@@ -11,22 +15,35 @@ class BowlingGame:
     Class defining a Bowling game, containing players and keeping scores.
     """
 
-    def __init__(self, players: List[PLAYER_NAME]):
+    def __init__(self, players: List[PLAYER_NAME], lazy: bool = False):
         """
         Creates a new Bowling game.
 
         Args:
             players: A list containing the name of all the players taking part to this game.
+                     The duplicated names are suffixed with _2, _3, ...
+            lazy: True to compute the scores of the frames registered by registerRoll only when they are read
+                  (through BowlingFrame.getScore, getScore, the rendering, ...), instead of after each throwing.
         """
         players_without_duplicates = []
+        used_names = set()
+        next_suffixes = {}  # type: Dict[PLAYER_NAME, int]
         for player in players:
-            if player in players_without_duplicates:
-                players_without_duplicates.append(player + "_2")
-            else:
-                players_without_duplicates.append(player)
+            name = player
+            suffix = next_suffixes.get(player, 2)
+            while name in used_names:
+                name = "%s_%d" % (player, suffix)
+                suffix += 1
+            next_suffixes[player] = suffix
+            used_names.add(name)
+            players_without_duplicates.append(name)
         self.players = players_without_duplicates  # type: List[PLAYER_NAME]
         self.scores = {}  # type: Dict[PLAYER_NAME, PLAYER_SCORE]
         self.frames = {}  # type: Dict[PLAYER_NAME, List[BowlingFrame]]
+        self.lazy = lazy
+        # Index of the first frame of each player whose score may be outdated, in lazy mode
+        self._dirtyIndexes = {}  # type: Dict[PLAYER_NAME, int]
+        self._renderer = ScoreboardRenderer()
         self.reset()
 
     def reset(self):
@@ -35,6 +52,7 @@ class BowlingGame:
         """
         self.scores = {player: 0 for player in self.players}
         self.frames = {player: [] for player in self.players}
+        self._dirtyIndexes = {}
 
     def play(self, predefined_actions: Optional[List[NUMBER_OF_PINS]]=None, verbose: bool=True):
         """
@@ -69,6 +87,211 @@ class BowlingGame:
             if answer.strip().lower() == 'y':
                 self.play()
 
+    def registerRoll(self, player: PLAYER_NAME, nb_pins: NUMBER_OF_PINS) -> List[BowlingFrame]:
+        """
+        Registers the result of a throwing of a player, without blocking nor displaying anything.
+        Only the three last frames of the player can be affected by a throwing, so this takes a constant time.
+
+        Args:
+            player: The name of the player who threw the ball.
+            nb_pins: The number of pins that fell during this throwing.
+
+        Returns: The frames of the player whose score has changed because of this throwing
+                 (always empty in lazy mode, as the scores are not computed)
+
+        Raises:
+            ValueError: If the player does not take part in this game, if their game is already finished,
+                        or if the number of pins is negative.
+            PinsOverflowError: If too much pins seem to have been knocked down in the current frame.
+        """
+        frames = self.frames.get(player)
+        if frames is None:
+            raise ValueError("%s does not take part in this game" % player)
+        new_frame = len(frames) == 0 or frames[-1].isFinished
+        if new_frame:
+            if len(frames) == 10:
+                raise ValueError("The game of %s is already finished" % player)
+            frames.append(BowlingFrame(player, ending=len(frames) == 9))
+            if self.lazy:
+                frames[-1]._resolver = functools.partial(self._resolve, player)
+        if self.lazy:
+            try:
+                frames[-1].registerThrowing(nb_pins)
+            except (ValueError, PinsOverflowError):
+                if new_frame:
+                    frames.pop()
+                raise
+            # Only the three last frames can be affected by this throwing
+            first_dirty = max(0, len(frames) - 3)
+            self._dirtyIndexes[player] = min(self._dirtyIndexes.get(player, first_dirty), first_dirty)
+            return []
+        watched_frames = frames[-3:]
+        previous_scores = [frame.getScore() for frame in watched_frames]
+        try:
+            frames[-1].registerThrowing(nb_pins)
+        except (ValueError, PinsOverflowError):
+            if new_frame:
+                frames.pop()
+            raise
+        self._informPreviousFrames(frames)
+        changed_frames = [frame for frame, previous_score in zip(watched_frames, previous_scores)
+                          if frame.getScore() != previous_score]
+        if len(changed_frames) != 0:
+            self.scores[player] = changed_frames[-1].getScore()
+        return changed_frames
+
+    def _resolve(self, player: PLAYER_NAME):
+        """
+        Computes the scores of the frames of a player that may be outdated, in lazy mode, in a single pass from
+        the first of them.
+
+        Args:
+            player: The name of the player.
+        """
+        start = self._dirtyIndexes.pop(player, None)
+        if start is None:
+            return
+        frames = self.frames[player]
+        # The frame before the first outdated one propagates its accumulated score
+        start = max(0, start - 1)
+        # The last frame already has its score if it can be computed without any next frame
+        for index in range(start, len(frames) - 1):
+            next_next_frame = frames[index + 2] if index + 2 < len(frames) else None
+            frames[index].computeScore(frames[index + 1], next_next_frame)
+        last_scored = len(frames) - 1
+        while last_scored >= start and frames[last_scored]._score is None:
+            last_scored -= 1
+        if last_scored >= start:
+            self.scores[player] = frames[last_scored].getScore()
+
+    def getScore(self, player: PLAYER_NAME) -> PLAYER_SCORE:
+        """
+        Args:
+            player: The name of the player.
+
+        Returns: The score accumulated by the player until now (the scores dictionary is only updated when
+                 the scores are read in lazy mode)
+        """
+        self._resolve(player)
+        return self.scores[player]
+
+    def correctThrowing(self, player: PLAYER_NAME, frame_index: int, throwing_index: int,
+                        nb_pins: NUMBER_OF_PINS) -> List[BowlingFrame]:
+        """
+        Corrects the result of a throwing already registered, without replaying the game.
+        Only the corrected frame is validated again. The scores of the corrected frame and of the two frames before
+        it are computed again, and the accumulated score of the frames after it is updated.
+
+        Args:
+            player: The name of the player who threw the ball.
+            frame_index: The index (in [0, 9]) of the frame of the throwing.
+            throwing_index: The index of the throwing in the frame.
+            nb_pins: The number of pins that actually fell during this throwing.
+
+        Returns: The frames of the player whose score has changed because of this correction
+
+        Raises:
+            ValueError: If the player does not take part in this game, if there is no such throwing, if the number
+                        of pins is negative, or if the correction changes the number of throwing of the frame.
+            PinsOverflowError: If too much pins seem to have been knocked down in the frame after the correction.
+        """
+        frames = self.frames.get(player)
+        if frames is None:
+            raise ValueError("%s does not take part in this game" % player)
+        if not 0 <= frame_index < len(frames):
+            raise ValueError("There is no frame %d for %s" % (frame_index, player))
+        self._resolve(player)
+        start = max(0, frame_index - 2)
+        previous_scores = [frame.getScore() for frame in frames[start:]]
+        frames[frame_index].replaceThrowing(throwing_index, nb_pins)
+        for index in range(start, frame_index):
+            frames[index].resetScore()
+        end = len(frames)
+        if len(frames[-1].getThrowing()) == 0:
+            # The last frame has just been created, without any throwing
+            end -= 1
+        # The last frame already has its score if it can be computed without any next frame
+        for index in range(start, end - 1):
+            next_next_frame = frames[index + 2] if index + 2 < end else None
+            frames[index].computeScore(frames[index + 1], next_next_frame)
+        changed_frames = [frame for frame, previous_score in zip(frames[start:], previous_scores)
+                          if frame.getScore() != previous_score]
+        last_scored = len(frames) - 1
+        while last_scored >= 0 and frames[last_scored].getScore() is None:
+            last_scored -= 1
+        self.scores[player] = frames[last_scored].getScore() if last_scored >= 0 else 0
+        return changed_frames
+
+    def getScoreBounds(self, player: PLAYER_NAME) -> Tuple[PLAYER_SCORE, PLAYER_SCORE]:
+        """
+        Gives the minimum and the maximum final scores that a player can still achieve.
+        Only the frames still waiting for their score (at most three) are looked at, so this takes a constant time.
+
+        Args:
+            player: The name of the player.
+
+        Returns: The minimum final score (if all the remaining throwing miss) and the maximum final score
+                 (if all the remaining throwing knock down every standing pin)
+        """
+        self._resolve(player)
+        frames = self.frames[player]
+        first_waiting = len(frames)
+        while first_waiting > 0 and frames[first_waiting - 1].isWaitingForNextRound():
+            first_waiting -= 1
+        minimum = frames[first_waiting - 1].getScore() if first_waiting > 0 else 0
+        following_throwing = []  # type: List[NUMBER_OF_PINS]
+        next_bonus = 0  # Number of waiting frames for which the next throwing counts as a bonus
+        second_next_bonus = 0  # Number of waiting frames for which the throwing after that counts as a bonus
+        for index in range(len(frames) - 1, first_waiting - 1, -1):
+            # The waiting frames are gone through backwards, to know the throwing that follow each of them
+            frame = frames[index]
+            nb_bonus = frame.getNbOfBonusThrowing() if frame.isFinished else 0
+            minimum += frame.getNbOfKnockedDownPins() + sum(following_throwing[:nb_bonus])
+            nb_missing_bonus = nb_bonus - len(following_throwing)
+            next_bonus += nb_missing_bonus >= 1
+            second_next_bonus += nb_missing_bonus >= 2
+            following_throwing = list(frame.getThrowing()) + following_throwing
+        if len(frames) == 0 or frames[-1].isFinished:
+            if len(frames) == 10:
+                return minimum, minimum
+            # The next throwing starts a new frame
+            return minimum, minimum + self._maxRemainingScore(len(frames) + 1, (), next_bonus, second_next_bonus)
+        return minimum, minimum + self._maxRemainingScore(len(frames), frames[-1].getThrowing(),
+                                                          next_bonus, second_next_bonus)
+
+    @staticmethod
+    def _maxRemainingScore(frame_nb: int, throwing: Tuple[NUMBER_OF_PINS, ...], next_bonus: int,
+                           second_next_bonus: int) -> PLAYER_SCORE:
+        """
+        Computes the points brought by the remaining throwing of a game if they all knock down every standing pin.
+
+        Args:
+            frame_nb: The number (in [1, 10]) of the frame of the next throwing.
+            throwing: The throwing already performed in that frame.
+            next_bonus: The number of previous frames for which the next throwing counts as a bonus.
+            second_next_bonus: The number of previous frames for which the throwing after that counts as a bonus.
+
+        Returns: The maximum number of points that the remaining throwing can bring
+        """
+        if len(throwing) == 0:
+            # Strikes until the end: one throwing per frame, three in the ending frame,
+            #  each strike of a non-ending frame counting its two next throwing twice
+            return 10 * (13 - frame_nb) + 20 * (10 - frame_nb) + 10 * (next_bonus + second_next_bonus)
+        if frame_nb != 10:
+            # A spare completes the frame, then strikes until the end
+            standing = 10 - throwing[0]
+            return standing * (1 + next_bonus) + \
+                BowlingGame._maxRemainingScore(frame_nb + 1, (), second_next_bonus + 1, 0)
+        if len(throwing) == 1:
+            if throwing[0] >= 10:
+                return 20 + 10 * next_bonus
+            return (10 - throwing[0]) * (1 + next_bonus) + 10
+        if len(throwing) == 2 and throwing[0] + throwing[1] >= 10:
+            if throwing[0] >= 10 and throwing[1] < 10:
+                return 10 - throwing[1]
+            return 10
+        return 0
+
     @staticmethod
     def computeScoreOnFrames(frames: List[BowlingFrame]) -> Union[PLAYER_SCORE, None]:
         """
@@ -85,12 +308,19 @@ class BowlingGame:
         for frame in frames:
             if not frame.isFinished:
                 raise ValueError("Cannot compute the score of unfinished frames")
-        for i in range(2, len(frames) + 1):
-            BowlingGame._informPreviousFrames(frames[:i])
+        # Single pass: each frame is informed of its two successors, without copying any prefix of the list
+        previous_frame = None
+        frame = frames[0]
+        for i in range(1, len(frames)):
+            next_frame = frames[i]
+            if previous_frame is not None:
+                previous_frame.computeScore(frame, next_frame)
+            frame.computeScore(next_frame)
+            previous_frame, frame = frame, next_frame
         return frames[-1].getScore()
 
     @staticmethod
-    def computeScore(throwing_list: List[NUMBER_OF_PINS]) -> Union[PLAYER_SCORE, None]:
+    def computeScore(throwing_list: List[NUMBER_OF_PINS], engine: str = 'frames') -> Union[PLAYER_SCORE, None]:
         """
         Computes the score of a Bowling game, given the number of pins that the player knocked down at each throwing.
         Limits itself at 10 frames. The given list of throwing must contain enough throwing to complete
@@ -101,13 +331,19 @@ class BowlingGame:
             throwing_list:
                 The list containing the number of pins knocked down at each throwing if it is defined.
                 If the score can not be defined yet, return None
-             
+            engine: The scoring engine: 'frames' to build BowlingFrame objects, or 'fsm' to use the precomputed
+                    transition tables of the finite-state machine scorer.
 
         Returns: The score obtained for the given list of throwing
         
         Raises:
-            ValueError: If there are not enough throwing to complete one or multiple frames.
+            ValueError: If there are not enough throwing to complete one or multiple frames, or if the engine
+                        is unknown.
         """
+        if engine == 'fsm':
+            return fsm.computeScore(throwing_list)
+        if engine != 'frames':
+            raise ValueError("Unknown scoring engine: %s" % engine)
         frames = []  # type: List[BowlingFrame]
         index = 0
         while len(frames) != 10 and index != len(throwing_list):
@@ -122,6 +358,24 @@ class BowlingGame:
             frames.append(new_frame)
         return BowlingGame.computeScoreOnFrames(frames)
 
+    @staticmethod
+    def computeScores(games: Sequence[Sequence[NUMBER_OF_PINS]],
+                      padding: Optional[NUMBER_OF_PINS] = None) -> List[Union[PLAYER_SCORE, None]]:
+        """
+        Computes the score of many Bowling games at once, with the same rules as computeScore.
+        The games are scored in a single pass over their throwing, without building any frame.
+
+        Args:
+            games: A 2-D sequence containing one row of throwing (up to 21) per game.
+            padding: The value used to pad the rows, if any. A row ends at its first padding value.
+
+        Returns: The list of the scores obtained by the given games, in the same order
+
+        Raises:
+            ValueError: If there are not enough throwing to complete one or multiple frames of a game.
+        """
+        return computeScores(games, padding)
+
     @staticmethod
     def _informPreviousFrames(frames: List[BowlingFrame]):
         """
@@ -136,13 +390,4 @@ class BowlingGame:
             frames[-2].computeScore(frames[-1])
 
     def __str__(self):
-        string = "\n"
-        for player, frames in self.frames.items():
-            string += player + '\n'
-            for frame in frames:
-                string += frame.__str__() + ' '
-            string += '\n'
-            for frame in frames:
-                string += frame.__str__(True) + ' '
-            string += '\n\n'
-        return string
\ No newline at end of file
+        return self._renderer.render(self.frames)
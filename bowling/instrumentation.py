@@ -0,0 +1,107 @@
+"""
+Opt-in instrumentation of the scoring hot paths.
+Once enabled, the calls of the instrumented methods are counted and timed. When disabled (the default), the original
+methods are left untouched, so the instrumentation costs nothing.
+"""
+
+import functools
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from .frame import BowlingFrame
+from .game import BowlingGame
+from .render import ScoreboardRenderer
+
+__author__ = 'Anthony Rouneau'
+
+INSTRUMENTED_METHODS = [
+    (BowlingFrame, 'registerThrowing'),
+    (BowlingFrame, 'computeScore'),
+    (BowlingFrame, '__str__'),
+    (BowlingGame, '_informPreviousFrames'),
+    (BowlingGame, '__str__'),
+    (ScoreboardRenderer, 'render'),
+]  # type: List[Tuple[type, str]]
+
+_stats = {}  # type: Dict[str, List[float]]  # Method name -> [number of calls, total duration in seconds]
+_originals = {}  # type: Dict[Tuple[type, str], Any]
+
+
+def _instrument(name: str, function: Callable) -> Callable:
+    """
+    Returns: A function counting and timing the calls of the given function
+    """
+    stats = _stats.setdefault(name, [0, 0.0])
+    perf_counter = time.perf_counter
+
+    @functools.wraps(function)
+    def instrumented(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            stats[0] += 1
+            stats[1] += perf_counter() - start
+    return instrumented
+
+
+def enable():
+    """
+    Starts counting and timing the calls of the instrumented methods.
+    """
+    for cls, method_name in INSTRUMENTED_METHODS:
+        if (cls, method_name) in _originals:
+            continue
+        original = cls.__dict__[method_name]
+        name = "%s.%s" % (cls.__name__, method_name)
+        if isinstance(original, staticmethod):
+            setattr(cls, method_name, staticmethod(_instrument(name, original.__func__)))
+        else:
+            setattr(cls, method_name, _instrument(name, original))
+        _originals[(cls, method_name)] = original
+
+
+def disable():
+    """
+    Stops counting and timing the calls, and restores the original methods. The statistics are kept.
+    """
+    for (cls, method_name), original in _originals.items():
+        setattr(cls, method_name, original)
+    _originals.clear()
+
+
+def isEnabled() -> bool:
+    """
+    Returns: True if the calls of the instrumented methods are currently counted and timed
+    """
+    return len(_originals) != 0
+
+
+def reset():
+    """
+    Resets the statistics of all the instrumented methods.
+    """
+    for stats in _stats.values():
+        stats[0] = 0
+        stats[1] = 0.0
+
+
+def getStats() -> Dict[str, Dict[str, float]]:
+    """
+    Returns: The number of calls and the total duration (in seconds) of each instrumented method
+    """
+    return {name: {'calls': stats[0], 'seconds': stats[1]} for name, stats in _stats.items()}
+
+
+def toPrometheus() -> str:
+    """
+    Returns: The statistics of the instrumented methods, in the Prometheus text exposition format
+    """
+    lines = ["# HELP bowling_calls_total Number of calls of the instrumented bowling methods.",
+             "# TYPE bowling_calls_total counter"]
+    lines += ['bowling_calls_total{method="%s"} %d' % (name, stats[0]) for name, stats in sorted(_stats.items())]
+    lines += ["# HELP bowling_call_seconds_total Total time spent in the instrumented bowling methods.",
+              "# TYPE bowling_call_seconds_total counter"]
+    lines += ['bowling_call_seconds_total{method="%s"} %.9f' % (name, stats[1])
+              for name, stats in sorted(_stats.items())]
+    return "\n".join(lines) + "\n"
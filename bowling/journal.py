@@ -0,0 +1,247 @@
+"""
+Append-only journal of the games in progress, allowing to recover them after a crash.
+The journal is a directory containing:
+    - journal.log: one JSON event per line, appended in batches followed by an fsync:
+        {"event": "open", "game": id, "players": [...]}
+        {"event": "roll", "game": id, "player": name, "pins": n}
+        {"event": "close", "game": id}
+    - snapshot.json: the throwing of every open game, and the offset of the first event of the log that is not
+      included in the snapshot. It is replaced atomically.
+The recovery loads the snapshot and only replays the events written after it. An event that was not completely
+written when the crash happened is ignored, and removed from the log.
+"""
+
+import json
+import os
+from typing import Any, BinaryIO, Dict, List
+
+from .const import NUMBER_OF_PINS, PLAYER_NAME
+from .frame import BowlingFrame
+from .game import BowlingGame
+
+__author__ = 'Anthony Rouneau'
+
+LOG_NAME = 'journal.log'
+SNAPSHOT_NAME = 'snapshot.json'
+DEFAULT_EVENTS_PER_SYNC = 64
+DEFAULT_EVENTS_PER_SNAPSHOT = 2000
+
+EVENT = Dict[str, Any]
+
+
+class GameJournal:
+    """
+    Class keeping the games in progress in memory, and journaling each of their changes on disk.
+    Creating a journal on a directory that already contains one recovers its games.
+    """
+
+    def __init__(self, directory: str, events_per_sync: int = DEFAULT_EVENTS_PER_SYNC,
+                 events_per_snapshot: int = DEFAULT_EVENTS_PER_SNAPSHOT):
+        """
+        Opens the journal stored in the given directory, creating it if needed.
+
+        Args:
+            directory: The directory of the journal.
+            events_per_sync: The number of events buffered before being written to the log and synced to the disk.
+                             The buffered events are lost in case of a crash.
+            events_per_snapshot: The number of events written to the log between two snapshots.
+        """
+        if events_per_sync < 1 or events_per_snapshot < 1:
+            raise ValueError("The events must be synced and snapshot at least once")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.eventsPerSync = events_per_sync
+        self.eventsPerSnapshot = events_per_snapshot
+        self.games = {}  # type: Dict[int, BowlingGame]
+        self._nextGameId = 1
+        self._buffer = []  # type: List[bytes]
+        self._nbEventsSinceSnapshot = 0
+        self._logPath = os.path.join(directory, LOG_NAME)
+        self._snapshotPath = os.path.join(directory, SNAPSHOT_NAME)
+        self._recover()
+        new_log = not os.path.exists(self._logPath)
+        self._log = open(self._logPath, 'ab')  # type: BinaryIO
+        if new_log:
+            self._syncDirectory()
+
+    def _recover(self):
+        """
+        Loads the last snapshot, if any, and replays the events of the log written after it.
+        """
+        offset = 0
+        if os.path.exists(self._snapshotPath):
+            with open(self._snapshotPath) as snapshot_file:
+                snapshot = json.load(snapshot_file)
+            offset = snapshot['offset']
+            self._nextGameId = snapshot['nextGame']
+            for game_id, players, frames in snapshot['games']:
+                game = BowlingGame(players)
+                for player, player_frames in zip(game.players, frames):
+                    for throwing in player_frames:
+                        for nb_pins in throwing:
+                            game.registerRoll(player, nb_pins)
+                self.games[game_id] = game
+        if not os.path.exists(self._logPath):
+            return
+        with open(self._logPath, 'r+b') as log_file:
+            log_file.seek(offset)
+            for line in log_file:
+                try:
+                    if not line.endswith(b'\n'):
+                        raise ValueError("Incomplete event")
+                    event = json.loads(line.decode('utf-8'))
+                except ValueError:
+                    # The last event was being written when the journal stopped: it is dropped
+                    log_file.seek(offset)
+                    log_file.truncate()
+                    break
+                self._apply(event)
+                self._nbEventsSinceSnapshot += 1
+                offset += len(line)
+
+    def _apply(self, event: EVENT):
+        """
+        Applies an event read from the log to the games in memory.
+        """
+        kind = event['event']
+        if kind == 'open':
+            self.games[event['game']] = BowlingGame(event['players'])
+            self._nextGameId = max(self._nextGameId, event['game'] + 1)
+        elif kind == 'roll':
+            self.games[event['game']].registerRoll(event['player'], event['pins'])
+        elif kind == 'close':
+            del self.games[event['game']]
+
+    def openGame(self, players: List[PLAYER_NAME]) -> int:
+        """
+        Starts a new game.
+
+        Args:
+            players: The names of the players taking part to the game.
+
+        Returns: The identifier of the new game
+        """
+        if len(players) == 0:
+            raise ValueError("A game needs at least one player")
+        game = BowlingGame(players)
+        game_id = self._nextGameId
+        self._nextGameId += 1
+        self.games[game_id] = game
+        self._append({'event': 'open', 'game': game_id, 'players': game.players})
+        return game_id
+
+    def registerRoll(self, game_id: int, player: PLAYER_NAME, nb_pins: NUMBER_OF_PINS) -> List[BowlingFrame]:
+        """
+        Registers the result of a throwing in a game. Only valid throwing are journaled.
+
+        Args:
+            game_id: The identifier of the game.
+            player: The name of the player who threw the ball.
+            nb_pins: The number of pins that fell during this throwing.
+
+        Returns: The frames of the player whose score has changed because of this throwing
+
+        Raises:
+            ValueError: If there is no such game, or if the throwing is not valid (see BowlingGame.registerRoll).
+            PinsOverflowError: If too much pins seem to have been knocked down in the current frame.
+        """
+        changed_frames = self.getGame(game_id).registerRoll(player, nb_pins)
+        self._append({'event': 'roll', 'game': game_id, 'player': player, 'pins': nb_pins})
+        return changed_frames
+
+    def closeGame(self, game_id: int):
+        """
+        Removes a game from the journal.
+
+        Args:
+            game_id: The identifier of the game.
+        """
+        self.getGame(game_id)
+        del self.games[game_id]
+        self._append({'event': 'close', 'game': game_id})
+
+    def getGame(self, game_id: int) -> BowlingGame:
+        """
+        Returns: The game with the given identifier
+
+        Raises:
+            ValueError: If there is no such game.
+        """
+        game = self.games.get(game_id)
+        if game is None:
+            raise ValueError("There is no game %s" % game_id)
+        return game
+
+    def _append(self, event: EVENT):
+        """
+        Buffers an event, writing the buffer to the log once it is full.
+        """
+        self._buffer.append(json.dumps(event, separators=(',', ':')).encode('utf-8') + b'\n')
+        if len(self._buffer) >= self.eventsPerSync:
+            self.sync()
+
+    def sync(self):
+        """
+        Writes the buffered events to the log and syncs it to the disk, taking a snapshot if enough events
+        have been written since the last one.
+        """
+        self._writeBuffer()
+        if self._nbEventsSinceSnapshot >= self.eventsPerSnapshot:
+            self.snapshot()
+
+    def _writeBuffer(self):
+        """
+        Writes the buffered events to the log and syncs it to the disk.
+        """
+        if len(self._buffer) != 0:
+            self._log.write(b''.join(self._buffer))
+            self._log.flush()
+            os.fsync(self._log.fileno())
+            self._nbEventsSinceSnapshot += len(self._buffer)
+            self._buffer = []
+
+    def snapshot(self):
+        """
+        Writes the throwing of every open game in a new snapshot, so that the recovery does not need to replay
+        the events already written to the log.
+        """
+        self._writeBuffer()
+        snapshot = {
+            'offset': self._log.tell(),
+            'nextGame': self._nextGameId,
+            'games': [[game_id, game.players, [[list(frame.getThrowing()) for frame in game.frames[player]]
+                                               for player in game.players]]
+                      for game_id, game in self.games.items()],
+        }
+        temporary_path = self._snapshotPath + '.tmp'
+        with open(temporary_path, 'w') as snapshot_file:
+            json.dump(snapshot, snapshot_file, separators=(',', ':'))
+            snapshot_file.flush()
+            os.fsync(snapshot_file.fileno())
+        os.replace(temporary_path, self._snapshotPath)
+        self._syncDirectory()
+        self._nbEventsSinceSnapshot = 0
+
+    def _syncDirectory(self):
+        """
+        Writes the entries of the journal directory on disk, so that a file created or replaced in it survives a crash.
+        """
+        directory_fd = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(directory_fd)
+        finally:
+            os.close(directory_fd)
+
+    def close(self):
+        """
+        Writes the buffered events to the log and closes it.
+        """
+        if not self._log.closed:
+            self.sync()
+            self._log.close()
+
+    def __enter__(self) -> 'GameJournal':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
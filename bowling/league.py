@@ -0,0 +1,151 @@
+import heapq
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from .const import PLAYER_NAME, PLAYER_SCORE
+from .game import BowlingGame
+
+__author__ = 'Anthony Rouneau'
+
+
+class PlayerRecord:
+    """
+    Class defining the running statistics of a player in a league, updated each time one of their games finishes.
+    """
+
+    __slots__ = ('player', 'nbGames', 'totalPins', 'highGame', 'series')
+
+    def __init__(self, player: PLAYER_NAME):
+        """
+        Creates the record of a player who has not played any game yet.
+
+        Args:
+            player: The name of the player.
+        """
+        self.player = player
+        self.nbGames = 0
+        self.totalPins = 0
+        self.highGame = None  # type: Optional[PLAYER_SCORE]
+        self.series = {}  # type: Dict[Hashable, PLAYER_SCORE]
+
+    def getAverage(self) -> Optional[float]:
+        """
+        Returns: The average score of the player, or None if they have not played any game yet
+        """
+        if self.nbGames == 0:
+            return None
+        return self.totalPins / self.nbGames
+
+    def getHighSeries(self) -> Optional[PLAYER_SCORE]:
+        """
+        Returns: The best series total of the player, or None if they have not played any series yet
+        """
+        if len(self.series) == 0:
+            return None
+        return max(self.series.values())
+
+
+class League:
+    """
+    Class holding the results of many finished games, indexed by player.
+    The statistics and the leaderboard are updated when a game is added, so that the standings never need to
+    go through the frames of the past games again.
+    """
+
+    def __init__(self, top_k: int = 10):
+        """
+        Creates a new, empty, league.
+
+        Args:
+            top_k: The number of best games kept in the leaderboard.
+        """
+        if top_k < 1:
+            raise ValueError("The leaderboard must be able to hold at least one game")
+        self.topK = top_k
+        self.players = {}  # type: Dict[PLAYER_NAME, PlayerRecord]
+        self._nbScores = 0
+        # Min-heap of the best games: the worst of them is the first one to be replaced
+        self._bestGames = []  # type: List[Tuple[PLAYER_SCORE, int, PLAYER_NAME]]
+
+    def addGame(self, game: BowlingGame, series_id: Optional[Hashable] = None):
+        """
+        Adds the scores of a finished game to the league.
+
+        Args:
+            game: The finished game to add.
+            series_id: The identifier of the series the game belongs to, if any.
+
+        Raises:
+            ValueError: If the game of one of the players is not finished.
+        """
+        scores = []  # type: List[Tuple[PLAYER_NAME, PLAYER_SCORE]]
+        for player in game.players:
+            frames = game.frames[player]
+            if len(frames) != 10 or not frames[-1].isFinished:
+                raise ValueError("The game of %s is not finished" % player)
+            scores.append((player, frames[-1].getScore()))
+        for player, score in scores:
+            self.addScore(player, score, series_id)
+
+    def addScore(self, player: PLAYER_NAME, score: PLAYER_SCORE, series_id: Optional[Hashable] = None):
+        """
+        Adds the final score of one game of a player to the league, in a time that does not depend on the number
+        of games already added.
+
+        Args:
+            player: The name of the player.
+            score: The final score of the game.
+            series_id: The identifier of the series the game belongs to, if any.
+        """
+        record = self.players.get(player)
+        if record is None:
+            record = self.players[player] = PlayerRecord(player)
+        record.nbGames += 1
+        record.totalPins += score
+        if record.highGame is None or score > record.highGame:
+            record.highGame = score
+        if series_id is not None:
+            record.series[series_id] = record.series.get(series_id, 0) + score
+
+        # On equal scores, the earliest game stays in the leaderboard
+        entry = (score, -self._nbScores, player)
+        self._nbScores += 1
+        if len(self._bestGames) < self.topK:
+            heapq.heappush(self._bestGames, entry)
+        elif entry > self._bestGames[0]:
+            heapq.heapreplace(self._bestGames, entry)
+
+    def getPlayer(self, player: PLAYER_NAME) -> PlayerRecord:
+        """
+        Args:
+            player: The name of the player.
+
+        Returns: The record of the player
+
+        Raises:
+            ValueError: If the player has not played any game in the league.
+        """
+        record = self.players.get(player)
+        if record is None:
+            raise ValueError("%s has not played any game in this league" % player)
+        return record
+
+    def getStandings(self, nb_players: Optional[int] = None) -> List[Tuple[PLAYER_NAME, float]]:
+        """
+        Args:
+            nb_players: The number of players to give (None to give all of them).
+
+        Returns: The players with the best averages and their average, sorted from the best one
+        """
+        if nb_players is None:
+            nb_players = len(self.players)
+        best_records = heapq.nlargest(nb_players, self.players.values(), key=PlayerRecord.getAverage)
+        return [(record.player, record.getAverage()) for record in best_records]
+
+    def getLeaderboard(self) -> List[Tuple[PLAYER_NAME, PLAYER_SCORE]]:
+        """
+        Returns: The best games of the league (at most top_k) and the player who played them, sorted from the best one
+        """
+        return [(player, score) for score, _, player in sorted(self._bestGames, reverse=True)]
+
+    def __len__(self) -> int:
+        return self._nbScores
@@ -0,0 +1,54 @@
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import IO, Deque, Iterable, Optional
+
+from .const import DEFAULT_CHUNK_SIZE
+from .stream import scoreChunk
+
+__author__ = 'Anthony Rouneau'
+
+
+def scoreParallel(lines: Iterable[str], output: IO[str], errors: IO[str], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                  workers: Optional[int] = None) -> int:
+    """
+    Computes the score of many games, one game per line, on a pool of processes.
+    The lines are split in chunks that are scored on the different processes. The scores are written
+    in the same order as the games, exactly like scoreStream would write them.
+    Only a few chunks per process are read in advance, so the memory used does not depend on the number of games.
+
+    Args:
+        lines: The lines containing the games (e.g. an opened file or sys.stdin).
+        output: The stream on which the scores are written.
+        errors: The stream on which the malformed lines are reported.
+        chunk_size: The number of lines sent to a process at once.
+        workers: The number of processes to use (None to use all the cores of the machine).
+
+    Returns: The number of malformed lines
+    """
+    if chunk_size < 1:
+        raise ValueError("The chunks must contain at least one line")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("At least one worker is needed to compute the scores")
+    nb_errors = 0
+    lines = iter(lines)
+    line_nb = 1
+    pending = deque()  # type: Deque[Future]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunk = list(islice(lines, chunk_size))
+        while len(chunk) != 0 or len(pending) != 0:
+            if len(chunk) != 0 and len(pending) < 2 * workers:
+                pending.append(executor.submit(scoreChunk, chunk, line_nb))
+                line_nb += len(chunk)
+                chunk = list(islice(lines, chunk_size))
+                continue
+            # Enough chunks are in progress: the oldest one is written before reading more lines
+            output_lines, error_lines = pending.popleft().result()
+            output.writelines(output_lines)
+            errors.writelines(error_lines)
+            nb_errors += len(error_lines)
+    output.flush()
+    return nb_errors
@@ -0,0 +1,70 @@
+from typing import Dict, List, Tuple, Union
+
+from .const import NUMBER_OF_PINS, PLAYER_NAME
+from .frame import BowlingFrame
+
+__author__ = 'Anthony Rouneau'
+
+# The frame that was rendered, the throwing and the score it was rendered with, and its two display lines
+RENDERED_FRAME = Tuple[BowlingFrame, Tuple[NUMBER_OF_PINS, ...], Union[int, None], str, str]
+
+
+class ScoreboardRenderer:
+    """
+    Class rendering the scoreboard of a bowling game.
+    The two display lines of each frame are cached, so that only the frames that changed since the last
+    rendering are rendered again.
+    """
+
+    def __init__(self):
+        """
+        Creates a new renderer, with an empty cache.
+        """
+        self._renderedFrames = {}  # type: Dict[PLAYER_NAME, List[RENDERED_FRAME]]
+        self._renderedLines = {}  # type: Dict[PLAYER_NAME, str]
+
+    def render(self, frames: Dict[PLAYER_NAME, List[BowlingFrame]]) -> str:
+        """
+        Renders a scoreboard. Gives the same result as BowlingGame.__str__ used to.
+
+        Args:
+            frames: The frames of each player of the game.
+
+        Returns: The string representation of the scoreboard
+        """
+        parts = ["\n"]
+        rendered_frames = {}  # type: Dict[PLAYER_NAME, List[RENDERED_FRAME]]
+        rendered_lines = {}  # type: Dict[PLAYER_NAME, str]
+        for player, player_frames in frames.items():
+            cached_frames = self._renderedFrames.get(player, [])
+            lines = self._renderedLines.get(player)
+            if len(cached_frames) > len(player_frames):
+                cached_frames = cached_frames[:len(player_frames)]
+                lines = None
+            for index, frame in enumerate(player_frames):
+                throwing = frame.getThrowing()
+                score = frame.getScore()
+                if index < len(cached_frames):
+                    cached_frame, cached_throwing, cached_score, _, _ = cached_frames[index]
+                    if cached_frame is frame and cached_throwing == throwing and cached_score == score:
+                        continue
+                    cached_frames[index] = (frame, throwing, score, frame.__str__() + ' ', frame.__str__(True) + ' ')
+                else:
+                    cached_frames.append((frame, throwing, score, frame.__str__() + ' ', frame.__str__(True) + ' '))
+                lines = None
+            if lines is None:
+                lines = "".join([player, '\n'] + [rendered[3] for rendered in cached_frames] + ['\n'] +
+                                [rendered[4] for rendered in cached_frames] + ['\n\n'])
+            rendered_frames[player] = cached_frames
+            rendered_lines[player] = lines
+            parts.append(lines)
+        self._renderedFrames = rendered_frames
+        self._renderedLines = rendered_lines
+        return "".join(parts)
+
+    def clear(self):
+        """
+        Empties the cache of this renderer.
+        """
+        self._renderedFrames = {}
+        self._renderedLines = {}
@@ -0,0 +1,112 @@
+"""
+Streaming reports of the scoreboards of many games, in text or in HTML.
+The games are written one by one through a buffered writer, so that the memory used does not depend on the
+number of games: they can be given by a generator. The marks of the throwing follow BowlingFrame.__str__.
+"""
+
+import html
+from typing import Iterable, TextIO
+
+from .game import BowlingGame
+
+__author__ = 'Anthony Rouneau'
+
+DEFAULT_BUFFER_SIZE = 65536
+REPORT_FORMATS = ('text', 'html')
+
+_HTML_HEADER = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>%s</title>
+<style>
+table.game { border-collapse: collapse; margin-bottom: 1em; }
+table.game th, table.game td { border: 1px solid #000; padding: 0 0.3em; text-align: center; }
+table.game td .marks { font-family: monospace; white-space: pre; }
+</style>
+</head>
+<body>
+<h1>%s</h1>
+"""
+_HTML_FOOTER = "</body>\n</html>\n"
+
+
+def writeTextReport(games: Iterable[BowlingGame], output: TextIO) -> int:
+    """
+    Writes the scoreboard of each game as text, with the same display lines as BowlingGame.__str__.
+
+    Args:
+        games: The games to write.
+        output: The stream on which the report is written.
+
+    Returns: The number of games written
+    """
+    nb_games = 0
+    for game in games:
+        nb_games += 1
+        output.write("Game %d\n\n" % nb_games)
+        for player, frames in game.frames.items():
+            output.write(player + '\n')
+            output.write(''.join([frame.__str__() + ' ' for frame in frames]) + '\n')
+            output.write(''.join([frame.__str__(True) + ' ' for frame in frames]) + '\n\n')
+    return nb_games
+
+
+def writeHtmlReport(games: Iterable[BowlingGame], output: TextIO, title: str = "Scoreboards") -> int:
+    """
+    Writes the scoreboard of each game as an HTML table, with one row per player and one cell per frame.
+
+    Args:
+        games: The games to write.
+        output: The stream on which the report is written.
+        title: The title of the HTML page.
+
+    Returns: The number of games written
+    """
+    title = html.escape(title)
+    output.write(_HTML_HEADER % (title, title))
+    nb_games = 0
+    for game in games:
+        nb_games += 1
+        output.write('<table class="game">\n<caption>Game %d</caption>\n<tr><th>Player</th>%s<th>Total</th></tr>\n'
+                     % (nb_games, ''.join(['<th>%d</th>' % frame_nb for frame_nb in range(1, 11)])))
+        for player, frames in game.frames.items():
+            cells = []
+            total = 0
+            for frame in frames:
+                score = frame.getScore()
+                if score is not None:
+                    total = score
+                cells.append('<td><div class="marks">%s</div><div class="score">%s</div></td>'
+                             % (html.escape(' '.join(frame.getMarks())), '' if score is None else score))
+            cells += ['<td></td>'] * (10 - len(frames))
+            # The total is the score of the last scored frame, as in the cells: the score kept by the game is only
+            #  updated by registerRoll
+            output.write('<tr><th>%s</th>%s<td>%d</td></tr>\n' % (html.escape(player), ''.join(cells), total))
+        output.write('</table>\n')
+    output.write(_HTML_FOOTER)
+    return nb_games
+
+
+def writeReport(games: Iterable[BowlingGame], path: str, report_format: str = 'text',
+                buffer_size: int = DEFAULT_BUFFER_SIZE) -> int:
+    """
+    Writes a report of the scoreboards of the given games in a file.
+
+    Args:
+        games: The games to write.
+        path: The path of the report.
+        report_format: The format of the report: 'text' or 'html'.
+        buffer_size: The size (in bytes) of the buffer of the writer.
+
+    Returns: The number of games written
+
+    Raises:
+        ValueError: If the format is unknown.
+    """
+    if report_format not in REPORT_FORMATS:
+        raise ValueError("Unknown report format: %s" % report_format)
+    with open(path, 'w', buffering=buffer_size, encoding='utf-8') as output:
+        if report_format == 'html':
+            return writeHtmlReport(games, output)
+        return writeTextReport(games, output)
@@ -0,0 +1,254 @@
+"""
+Asyncio scoring server hosting many concurrent games.
+It uses a line-based protocol: each request and each response is a JSON object on one line.
+Requests:
+    {"op": "open", "players": [...]}                          -> {"ok": true, "game": id, "players": [...]}
+    {"op": "roll", "game": id, "player": name, "pins": n}    -> {"ok": true, "changed": [[frame index, score], ...]}
+    {"op": "board", "game": id}                               -> {"ok": true, "frames": {...}, "scores": {...}}
+    {"op": "close", "game": id}                               -> {"ok": true}
+    {"op": "score", "throwing": [...]}                        -> {"ok": true, "score": score}
+A request that cannot be served gets {"ok": false, "error": message}. A request line longer than MAX_REQUEST_SIZE
+gets such an error too, and no other request of the connection is served.
+"""
+
+import asyncio
+import json
+from typing import Any, Dict, List, Optional
+
+from .const import PLAYER_NAME, NUMBER_OF_PINS
+from .frame import PinsOverflowError
+from .game import BowlingGame
+
+MAX_REQUEST_SIZE = 64 * 1024
+
+__author__ = 'Anthony Rouneau'
+
+REQUEST = Dict[str, Any]
+RESPONSE = Dict[str, Any]
+
+
+class ScoringServer:
+    """
+    Class defining an asyncio server hosting many concurrent bowling games.
+    """
+
+    def __init__(self):
+        """
+        Creates a new scoring server, without any game.
+        """
+        self.games = {}  # type: Dict[int, BowlingGame]
+        self._nextGameId = 1
+        self._server = None  # type: Optional[asyncio.AbstractServer]
+        self._connections = {}  # type: Dict[asyncio.StreamWriter, asyncio.Future]
+
+    def handleRequest(self, request: REQUEST) -> RESPONSE:
+        """
+        Serves one request of the protocol.
+
+        Args:
+            request: The decoded request.
+
+        Returns: The response to send back to the client
+        """
+        try:
+            operation = request.get('op')
+            if operation == 'open':
+                return self._open(request['players'])
+            if operation == 'score':
+                return self._score(request['throwing'])
+            game = self.games.get(request['game'])
+            if game is None:
+                raise ValueError("There is no game %s on this server" % request['game'])
+            if operation == 'roll':
+                return self._roll(game, request['player'], request['pins'])
+            if operation == 'board':
+                return self._board(game)
+            if operation == 'close':
+                del self.games[request['game']]
+                return {'ok': True}
+            raise ValueError("Unknown operation %s" % operation)
+        except KeyError as error:
+            return {'ok': False, 'error': "Missing field %s" % error}
+        except (ValueError, TypeError, PinsOverflowError) as error:
+            return {'ok': False, 'error': str(error)}
+
+    def _open(self, players: List[PLAYER_NAME]) -> RESPONSE:
+        if not isinstance(players, list) or len(players) == 0:
+            raise ValueError("A game needs at least one player")
+        game = BowlingGame(players)
+        game_id = self._nextGameId
+        self._nextGameId += 1
+        self.games[game_id] = game
+        return {'ok': True, 'game': game_id, 'players': game.players}
+
+    @staticmethod
+    def _score(throwing_list: List[NUMBER_OF_PINS]) -> RESPONSE:
+        if not isinstance(throwing_list, list):
+            raise ValueError("The throwing must be given as a list")
+        return {'ok': True, 'score': BowlingGame.computeScore(throwing_list)}
+
+    @staticmethod
+    def _roll(game: BowlingGame, player: PLAYER_NAME, nb_pins: NUMBER_OF_PINS) -> RESPONSE:
+        if not isinstance(nb_pins, int):
+            raise ValueError("The number of pins must be an integer")
+        changed_frames = game.registerRoll(player, nb_pins)
+        frames = game.frames[player]
+        changed = [[index, frames[index].getScore()] for index in range(max(0, len(frames) - 3), len(frames))
+                   if frames[index] in changed_frames]
+        return {'ok': True, 'changed': changed}
+
+    @staticmethod
+    def _board(game: BowlingGame) -> RESPONSE:
+        return {'ok': True,
+                'frames': {player: [list(frame.getThrowing()) for frame in frames]
+                           for player, frames in game.frames.items()},
+                'scores': {player: [frame.getScore() for frame in frames]
+                           for player, frames in game.frames.items()}}
+
+    async def _handleConnection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Serves the requests of one client until it closes the connection.
+        """
+        finished = asyncio.get_event_loop().create_future()
+        self._connections[writer] = finished
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # The line is longer than MAX_REQUEST_SIZE: what follows it cannot be told apart from the next
+                    #  requests, so no other request is served. The rest of the input is discarded until the client
+                    #  closes the connection, so that the error is not lost in a reset of the connection.
+                    response = {'ok': False, 'error': "Malformed request: longer than %d bytes" % MAX_REQUEST_SIZE}
+                    writer.write(json.dumps(response).encode() + b'\n')
+                    writer.write_eof()
+                    await writer.drain()
+                    while await reader.read(MAX_REQUEST_SIZE):
+                        pass
+                    break
+                if not line:
+                    break
+                try:
+                    request = json.loads(line.decode())
+                    if not isinstance(request, dict):
+                        raise ValueError("A request must be a JSON object")
+                    response = self.handleRequest(request)
+                except ValueError as error:
+                    response = {'ok': False, 'error': "Malformed request: %s" % error}
+                writer.write(json.dumps(response).encode() + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            del self._connections[writer]
+            finished.set_result(None)
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0,
+                    path: Optional[str] = None) -> asyncio.AbstractServer:
+        """
+        Starts serving the clients, on a TCP port or on a Unix socket.
+
+        Args:
+            host: The host on which the TCP server listens.
+            port: The TCP port on which the server listens (0 to pick a free port).
+            path: The path of the Unix socket on which the server listens. If given, the host and port are ignored.
+
+        Returns: The started asyncio server
+        """
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._handleConnection, path=path, limit=MAX_REQUEST_SIZE)
+        else:
+            self._server = await asyncio.start_server(self._handleConnection, host, port, limit=MAX_REQUEST_SIZE)
+        return self._server
+
+    async def stop(self):
+        """
+        Stops serving: closes the server and the connections of its clients, and waits until they are closed.
+        The games are kept.
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for writer in list(self._connections):
+            writer.close()
+        await asyncio.gather(*self._connections.values())
+
+
+class ScoringClient:
+    """
+    Class defining an asyncio client of the scoring server.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Creates a client on an opened connection. Use ScoringClient.connect to open the connection.
+        """
+        self._reader = reader
+        self._writer = writer
+
+    @staticmethod
+    async def connect(host: str = '127.0.0.1', port: int = 0, path: Optional[str] = None) -> 'ScoringClient':
+        """
+        Opens a connection to a scoring server.
+
+        Args:
+            host: The host of the TCP server.
+            port: The TCP port of the server.
+            path: The path of the Unix socket of the server. If given, the host and port are ignored.
+
+        Returns: The connected client
+        """
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return ScoringClient(reader, writer)
+
+    async def request(self, request: REQUEST) -> RESPONSE:
+        """
+        Sends a request to the server and waits for its response.
+
+        Raises:
+            ValueError: If the server could not serve the request.
+        """
+        self._writer.write(json.dumps(request).encode() + b'\n')
+        await self._writer.drain()
+        line = await self._reader.readline()
+        if not line:
+            raise ConnectionError("The scoring server closed the connection")
+        response = json.loads(line.decode())
+        if not response['ok']:
+            raise ValueError(response['error'])
+        return response
+
+    async def open(self, players: List[PLAYER_NAME]) -> int:
+        """
+        Returns: The identifier of a new game between the given players
+        """
+        return (await self.request({'op': 'open', 'players': players}))['game']
+
+    async def roll(self, game_id: int, player: PLAYER_NAME, nb_pins: NUMBER_OF_PINS) -> List[List[int]]:
+        """
+        Returns: The index and the new score of each frame whose score changed because of this throwing
+        """
+        return (await self.request({'op': 'roll', 'game': game_id, 'player': player, 'pins': nb_pins}))['changed']
+
+    async def board(self, game_id: int) -> RESPONSE:
+        """
+        Returns: The throwing and the scores of each frame of each player of the game
+        """
+        return await self.request({'op': 'board', 'game': game_id})
+
+    async def closeGame(self, game_id: int):
+        """
+        Removes a game from the server.
+        """
+        await self.request({'op': 'close', 'game': game_id})
+
+    def close(self):
+        """
+        Closes the connection to the server.
+        """
+        self._writer.close()
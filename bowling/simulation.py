@@ -0,0 +1,138 @@
+import os
+import random
+from bisect import bisect
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import accumulate
+from typing import Deque, Iterator, List, Optional, Sequence, Union
+
+from .const import PLAYER_SCORE
+
+__author__ = 'Anthony Rouneau'
+
+DEFAULT_BATCH_SIZE = 100000
+
+
+class SkillModel:
+    """
+    Class defining the skill of a player: how many pins their first ball knocks down on a full set of pins,
+    and how often they convert the pins left standing into a spare.
+    """
+
+    def __init__(self, first_ball: Sequence[float], spare_conversion: Union[float, Sequence[float]] = 0.0):
+        """
+        Creates a new skill model.
+
+        Args:
+            first_ball: The probabilities of knocking down 0, 1, ..., 10 pins with a ball thrown on a full set of pins.
+            spare_conversion: The probability of knocking down all the pins left standing after a first ball,
+                              either for any number of standing pins, or for each number (in [0, 10]) of standing
+                              pins. A missed spare knocks down a uniformly random number of the standing pins.
+
+        Raises:
+            ValueError: If the probabilities are not valid.
+        """
+        if len(first_ball) != 11 or any(probability < 0 for probability in first_ball) \
+                or abs(sum(first_ball) - 1) > 1e-9:
+            raise ValueError("11 positive probabilities summing up to 1 are needed for the first ball")
+        if isinstance(spare_conversion, (int, float)):
+            spare_conversion = [spare_conversion] * 11
+        if len(spare_conversion) != 11 or not all(0 <= probability <= 1 for probability in spare_conversion):
+            raise ValueError("The spare conversion must be a probability, or 11 probabilities")
+        self.firstBall = tuple(first_ball)
+        self.spareConversion = tuple(spare_conversion)
+        # The cumulative probabilities allow to draw a first ball with a single bisection
+        self._cumulatedFirstBall = list(accumulate(first_ball))[:-1]
+
+
+def simulateBatch(model: SkillModel, batch_index: int, batch_size: int = DEFAULT_BATCH_SIZE,
+                  seed: int = 0) -> List[PLAYER_SCORE]:
+    """
+    Simulates a batch of games and computes their scores, without building any frame.
+    Each batch has its own random stream, derived from the seed and the index of the batch, so that a batch
+    always gives the same games, whatever the process that simulates it.
+
+    Args:
+        model: The skill of the player.
+        batch_index: The index of the batch in the simulation.
+        batch_size: The number of games in the batch.
+        seed: The seed of the simulation.
+
+    Returns: The scores of the simulated games
+    """
+    rng = random.Random("%d-%d" % (seed, batch_index))
+    draw = rng.random
+    cumulated_first_ball = model._cumulatedFirstBall
+    spare_conversion = model.spareConversion
+    scores = []  # type: List[PLAYER_SCORE]
+    for _ in range(batch_size):
+        score = 0
+        next_bonus = 0
+        second_next_bonus = 0
+        for _ in range(9):
+            first = bisect(cumulated_first_ball, draw())
+            score += first * (1 + next_bonus)
+            if first == 10:
+                next_bonus = second_next_bonus + 1
+                second_next_bonus = 1
+                continue
+            standing = 10 - first
+            second = standing if draw() < spare_conversion[standing] else int(draw() * standing)
+            score += second * (1 + second_next_bonus)
+            next_bonus = 1 if second == standing else 0
+            second_next_bonus = 0
+        # The ending frame: the bonus throwing after a strike or a spare are performed on a new set of pins
+        first = bisect(cumulated_first_ball, draw())
+        score += first * (1 + next_bonus)
+        if first == 10:
+            second = bisect(cumulated_first_ball, draw())
+            if second == 10:
+                third = bisect(cumulated_first_ball, draw())
+            else:
+                standing = 10 - second
+                third = standing if draw() < spare_conversion[standing] else int(draw() * standing)
+            score += second * (1 + second_next_bonus) + third
+        else:
+            standing = 10 - first
+            second = standing if draw() < spare_conversion[standing] else int(draw() * standing)
+            score += second * (1 + second_next_bonus)
+            if second == standing:
+                score += bisect(cumulated_first_ball, draw())
+        scores.append(score)
+    return scores
+
+
+def simulateGames(model: SkillModel, nb_games: int, seed: int = 0, batch_size: int = DEFAULT_BATCH_SIZE,
+                  workers: Optional[int] = 1) -> Iterator[List[PLAYER_SCORE]]:
+    """
+    Simulates many games, batch by batch, so that the memory used does not depend on the number of games.
+    The simulation is reproducible: the same seed and batch size always give the same scores, whatever the
+    number of processes used.
+
+    Args:
+        model: The skill of the player.
+        nb_games: The number of games to simulate.
+        seed: The seed of the simulation.
+        batch_size: The number of games simulated at once.
+        workers: The number of processes simulating the batches (None to use all the cores of the machine).
+
+    Returns: An iterator over the batches of scores, in order
+    """
+    if batch_size < 1:
+        raise ValueError("The batches must contain at least one game")
+    batch_sizes = (min(batch_size, nb_games - start) for start in range(0, nb_games, batch_size))
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers == 1:
+        for batch_index, size in enumerate(batch_sizes):
+            yield simulateBatch(model, batch_index, size, seed)
+        return
+    pending = deque()  # type: Deque[Future]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for batch_index, size in enumerate(batch_sizes):
+            if len(pending) == 2 * workers:
+                # Enough batches are in progress: the oldest one is given before simulating more games
+                yield pending.popleft().result()
+            pending.append(executor.submit(simulateBatch, model, batch_index, size, seed))
+        while len(pending) != 0:
+            yield pending.popleft().result()
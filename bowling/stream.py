@@ -0,0 +1,92 @@
+from itertools import islice
+from typing import IO, Iterable, List, Tuple, Union
+
+from .batch import computeRowScore
+from .const import NUMBER_OF_PINS, PLAYER_SCORE
+from .frame import PinsOverflowError
+
+__author__ = 'Anthony Rouneau'
+
+BUFFER_SIZE = 1 << 16
+LINES_PER_WRITE = 1024
+
+
+def parseThrowing(line: str) -> List[NUMBER_OF_PINS]:
+    """
+    Parses one line of a game file.
+
+    Args:
+        line: The number of pins knocked down at each throwing of the game, separated by spaces.
+
+    Returns: The list of the number of pins knocked down at each throwing
+
+    Raises:
+        ValueError: If one of the throwing is not an integer.
+    """
+    return [int(throwing) for throwing in line.split()]
+
+
+def scoreLine(line: str) -> Union[PLAYER_SCORE, None]:
+    """
+    Computes the score of the game written on one line of a game file.
+
+    Args:
+        line: The number of pins knocked down at each throwing of the game, separated by spaces.
+
+    Returns: The score obtained by the game (None if the score cannot be defined yet)
+
+    Raises:
+        ValueError: If the line is malformed or if the throwing leave a frame uncompleted.
+        PinsOverflowError: If the game knocks down more than 10 pins in one frame.
+    """
+    return computeRowScore(parseThrowing(line))
+
+
+def scoreChunk(lines: List[str], first_line_nb: int = 1) -> Tuple[List[str], List[str]]:
+    """
+    Computes the score of a chunk of lines of a game file.
+
+    Args:
+        lines: The lines of the chunk, one game per line.
+        first_line_nb: The number of the first line of the chunk in its file, used to report the malformed lines.
+
+    Returns: The output lines (one score per line, an empty line for each malformed line) and the error lines
+    """
+    output_lines = []  # type: List[str]
+    error_lines = []  # type: List[str]
+    for line_nb, line in enumerate(lines, first_line_nb):
+        try:
+            output_lines.append("%s\n" % scoreLine(line))
+        except (ValueError, PinsOverflowError) as error:
+            output_lines.append("\n")
+            error_lines.append("line %d: %s\n" % (line_nb, error))
+    return output_lines, error_lines
+
+
+def scoreStream(lines: Iterable[str], output: IO[str], errors: IO[str]) -> int:
+    """
+    Computes the score of many games, one game per line, and writes one score per line.
+    The lines are consumed by chunks, so the memory used does not depend on the number of games.
+    A malformed line is reported on the error stream and gives an empty line in the output, so that
+    the n-th output line always corresponds to the n-th input line.
+
+    Args:
+        lines: The lines containing the games (e.g. an opened file or sys.stdin).
+        output: The stream on which the scores are written.
+        errors: The stream on which the malformed lines are reported.
+
+    Returns: The number of malformed lines
+    """
+    nb_errors = 0
+    lines = iter(lines)
+    line_nb = 1
+    chunk = list(islice(lines, LINES_PER_WRITE))
+    while len(chunk) != 0:
+        output_lines, error_lines = scoreChunk(chunk, line_nb)
+        output.writelines(output_lines)
+        errors.writelines(error_lines)
+        nb_errors += len(error_lines)
+        line_nb += len(chunk)
+        chunk = list(islice(lines, LINES_PER_WRITE))
+    output.flush()
+    return nb_errors
@@ -0,0 +1,240 @@
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Tuple
+
+from .const import PLAYER_NAME, PLAYER_SCORE
+from .game import BowlingGame
+
+__author__ = 'Anthony Rouneau'
+
+
+class Tournament:
+    """
+    Class defining a bowling tournament: bowlers are split into squads, which play their qualifying games on
+    the lanes of the center, moving from lane to lane after each game. The best bowlers of the qualifying
+    then play a bracket.
+    The bowlers are identified by their name, which must be unique in the tournament.
+    """
+
+    def __init__(self, nb_lanes: int, players_per_lane: int = 4, lane_shift: int = 1):
+        """
+        Creates a new tournament, without any bowler.
+
+        Args:
+            nb_lanes: The number of lanes of the bowling center.
+            players_per_lane: The number of bowlers playing on the same lane.
+            lane_shift: The number of lanes the bowlers of a lane move by after each game.
+        """
+        if nb_lanes < 1 or players_per_lane < 1:
+            raise ValueError("A tournament needs at least one lane and one bowler per lane")
+        self.nbLanes = nb_lanes
+        self.playersPerLane = players_per_lane
+        self.laneShift = lane_shift
+        self.bowlers = []  # type: List[PLAYER_NAME]
+        self._bowlerIndexes = {}  # type: Dict[PLAYER_NAME, int]
+        self._scores = {}  # type: Dict[PLAYER_NAME, Dict[int, PLAYER_SCORE]]
+        self._totals = {}  # type: Dict[PLAYER_NAME, PLAYER_SCORE]
+        # Sorted list of (-total, registration index) entries, updated for each recorded score
+        self._ranking = []  # type: List[Tuple[PLAYER_SCORE, int]]
+
+    def addBowler(self, name: PLAYER_NAME):
+        """
+        Registers a bowler in the tournament. The squads are made in the order of registration.
+
+        Args:
+            name: The name of the bowler.
+
+        Raises:
+            ValueError: If a bowler with the same name is already registered.
+        """
+        if name in self._bowlerIndexes:
+            raise ValueError("%s is already registered in this tournament" % name)
+        index = len(self.bowlers)
+        self._bowlerIndexes[name] = index
+        self.bowlers.append(name)
+        self._scores[name] = {}
+        self._totals[name] = 0
+        insort(self._ranking, (0, index))
+
+    def getSquads(self) -> List[List[PLAYER_NAME]]:
+        """
+        Returns: The squads of the tournament, each one filling all the lanes of the center
+        """
+        squad_size = self.nbLanes * self.playersPerLane
+        return [self.bowlers[start:start + squad_size] for start in range(0, len(self.bowlers), squad_size)]
+
+    def getLaneAssignment(self, squad_index: int, game_index: int) -> Dict[int, List[PLAYER_NAME]]:
+        """
+        Gives the lanes on which the bowlers of a squad play a game. The bowlers of a lane stay together,
+        and move by lane_shift lanes after each game.
+
+        Args:
+            squad_index: The index of the squad.
+            game_index: The index of the qualifying game.
+
+        Returns: The bowlers playing on each (non-empty) lane, lanes being numbered from 0
+        """
+        squad_size = self.nbLanes * self.playersPerLane
+        if not 0 <= squad_index * squad_size < len(self.bowlers):
+            raise ValueError("There is no squad %d in this tournament" % squad_index)
+        squad = self.bowlers[squad_index * squad_size:(squad_index + 1) * squad_size]
+        assignment = {}  # type: Dict[int, List[PLAYER_NAME]]
+        for start in range(0, len(squad), self.playersPerLane):
+            lane = (start // self.playersPerLane + game_index * self.laneShift) % self.nbLanes
+            assignment[lane] = squad[start:start + self.playersPerLane]
+        return assignment
+
+    def createGames(self, squad_index: int, game_index: int) -> Dict[int, BowlingGame]:
+        """
+        Args:
+            squad_index: The index of the squad.
+            game_index: The index of the qualifying game.
+
+        Returns: A new game for each lane on which the squad plays the given game
+        """
+        return {lane: BowlingGame(bowlers)
+                for lane, bowlers in self.getLaneAssignment(squad_index, game_index).items()}
+
+    def recordGame(self, game: BowlingGame, game_index: int):
+        """
+        Records the scores of a finished qualifying game.
+
+        Args:
+            game: The finished game.
+            game_index: The index of the qualifying game.
+
+        Raises:
+            ValueError: If the game of one of the bowlers is not finished, or if a bowler is not registered.
+        """
+        scores = []  # type: List[Tuple[PLAYER_NAME, PLAYER_SCORE]]
+        for player in game.players:
+            frames = game.frames[player]
+            if len(frames) != 10 or not frames[-1].isFinished:
+                raise ValueError("The game of %s is not finished" % player)
+            if player not in self._bowlerIndexes:
+                raise ValueError("%s is not registered in this tournament" % player)
+            scores.append((player, frames[-1].getScore()))
+        for player, score in scores:
+            self.recordScore(player, game_index, score)
+
+    def recordScore(self, bowler: PLAYER_NAME, game_index: int, score: PLAYER_SCORE):
+        """
+        Records (or corrects) the score of a qualifying game of a bowler. Only the total of this bowler is updated,
+        so this does not depend on the number of games already recorded.
+
+        Args:
+            bowler: The name of the bowler.
+            game_index: The index of the qualifying game.
+            score: The final score of the game.
+
+        Raises:
+            ValueError: If the bowler is not registered.
+        """
+        index = self._bowlerIndexes.get(bowler)
+        if index is None:
+            raise ValueError("%s is not registered in this tournament" % bowler)
+        scores = self._scores[bowler]
+        total = self._totals[bowler]
+        new_total = total - scores.get(game_index, 0) + score
+        scores[game_index] = score
+        self._totals[bowler] = new_total
+        ranking = self._ranking
+        del ranking[bisect_left(ranking, (-total, index))]
+        insort(ranking, (-new_total, index))
+
+    def getScores(self, bowler: PLAYER_NAME) -> Dict[int, PLAYER_SCORE]:
+        """
+        Returns: The score of each qualifying game recorded for the given bowler
+        """
+        return dict(self._scores[bowler])
+
+    def getStandings(self, nb_bowlers: Optional[int] = None) -> List[Tuple[PLAYER_NAME, PLAYER_SCORE]]:
+        """
+        Args:
+            nb_bowlers: The number of bowlers to give (None to give all of them).
+
+        Returns: The bowlers with the best qualifying totals and their total, sorted from the best one
+                 (the earliest registered one first on equal totals)
+        """
+        ranking = self._ranking if nb_bowlers is None else self._ranking[:nb_bowlers]
+        return [(self.bowlers[index], -negative_total) for negative_total, index in ranking]
+
+    def getCut(self, nb_qualified: int) -> 'Bracket':
+        """
+        Args:
+            nb_qualified: The number of bowlers qualified for the bracket.
+
+        Returns: The bracket played by the best bowlers of the qualifying, seeded by their rank
+        """
+        return Bracket([bowler for bowler, _ in self.getStandings(nb_qualified)])
+
+
+class Bracket:
+    """
+    Class defining a single-elimination bracket: in each round, the best seed plays the worst one, and so on.
+    The best seeds get a bye in the first round if the number of bowlers is not a power of two.
+    """
+
+    def __init__(self, seeds: List[PLAYER_NAME]):
+        """
+        Creates a new bracket.
+
+        Args:
+            seeds: The bowlers of the bracket, from the best seed to the worst one.
+        """
+        if len(seeds) == 0:
+            raise ValueError("A bracket needs at least one bowler")
+        self.seeds = list(seeds)
+        self.rounds = []  # type: List[List[Tuple[PLAYER_NAME, Optional[PLAYER_NAME]]]]
+        self._seedIndexes = {bowler: index for index, bowler in enumerate(seeds)}  # type: Dict[PLAYER_NAME, int]
+        self._winners = self.seeds if len(seeds) == 1 else []  # type: List[PLAYER_NAME]
+        size = 1
+        while size < len(seeds):
+            size *= 2
+        self._startRound(self.seeds + [None] * (size - len(seeds)))
+
+    def _startRound(self, bowlers: List[Optional[PLAYER_NAME]]):
+        """
+        Pairs the given bowlers, sorted by seed, for the next round, unless only the champion is left.
+        """
+        if len(bowlers) > 1:
+            self.rounds.append([(bowlers[index], bowlers[-index - 1]) for index in range(len(bowlers) // 2)])
+
+    def getMatches(self) -> List[Tuple[PLAYER_NAME, Optional[PLAYER_NAME]]]:
+        """
+        Returns: The matches of the current round (a None opponent being a bye)
+        """
+        if self.getChampion() is not None:
+            return []
+        return self.rounds[-1]
+
+    def recordRound(self, scores: Dict[PLAYER_NAME, PLAYER_SCORE]):
+        """
+        Records the results of the current round, and pairs the winners for the next one.
+        The best seed wins a match on equal scores.
+
+        Args:
+            scores: The score of each bowler playing the current round (bowlers with a bye do not need one).
+
+        Raises:
+            ValueError: If the bracket is over, or if the score of a bowler is missing.
+        """
+        matches = self.getMatches()
+        if len(matches) == 0:
+            raise ValueError("The bracket is over")
+        winners = []  # type: List[PLAYER_NAME]
+        for bowler, opponent in matches:
+            if opponent is None:
+                winners.append(bowler)
+                continue
+            if bowler not in scores or opponent not in scores:
+                raise ValueError("The scores of %s and %s are needed" % (bowler, opponent))
+            winners.append(opponent if scores[opponent] > scores[bowler] else bowler)
+        winners.sort(key=self._seedIndexes.__getitem__)
+        self._winners = winners
+        self._startRound(winners)
+
+    def getChampion(self) -> Optional[PLAYER_NAME]:
+        """
+        Returns: The winner of the bracket, or None if it is not over yet
+        """
+        return self._winners[0] if len(self._winners) == 1 else None
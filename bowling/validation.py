@@ -0,0 +1,107 @@
+from typing import List, Optional, Sequence, Tuple
+
+from .const import NUMBER_OF_PINS
+
+__author__ = 'Anthony Rouneau'
+
+# Error codes given by validateGames
+VALID = 0
+NEGATIVE_PINS = 1  # A throwing knocks down a negative number of pins
+FRAME_OVERFLOW = 2  # More than 10 pins are knocked down in a frame
+TENTH_FRAME_BONUS = 3  # A bonus throwing of the tenth frame knocks down more pins than there are standing
+TOO_MANY_ROLLS = 4  # There are throwing after the end of the game
+UNFINISHED_FRAME = 5  # The throwing stop in the middle of a frame (or before the tenth frame if partial is False)
+
+ERROR_MESSAGES = {
+    VALID: "Valid game",
+    NEGATIVE_PINS: "Cannot knock down a negative number of pins",
+    FRAME_OVERFLOW: "There are only 10 pins in a frame",
+    TENTH_FRAME_BONUS: "There are not enough pins standing for this bonus throwing",
+    TOO_MANY_ROLLS: "The game is over, no throwing can follow",
+    UNFINISHED_FRAME: "Not enough pins have been knocked down to finish the frame",
+}
+
+
+def validateGames(games: Sequence[Sequence[NUMBER_OF_PINS]], padding: Optional[NUMBER_OF_PINS] = None,
+                  partial: bool = False) -> Tuple[List[int], List[int]]:
+    """
+    Validates many games at once, without raising any exception.
+    Unlike BowlingFrame, the validation also enforces the rules of the bonus throwing of the tenth frame.
+
+    Args:
+        games: A 2-D sequence containing one row of throwing per game.
+        padding: The value used to pad the rows, if any. A row ends at its first padding value.
+        partial: True if games ending on a finished frame before the tenth one are valid.
+
+    Returns: The error code of each game (VALID, NEGATIVE_PINS, ...) and the offset of the first invalid throwing
+             of each game (-1 for a valid game, the length of the row for an unfinished frame)
+    """
+    codes = []  # type: List[int]
+    offsets = []  # type: List[int]
+    for row in games:
+        code, offset = validateGame(row, padding, partial)
+        codes.append(code)
+        offsets.append(offset)
+    return codes, offsets
+
+
+def validateGame(throwing_list: Sequence[NUMBER_OF_PINS], padding: Optional[NUMBER_OF_PINS] = None,
+                 partial: bool = False) -> Tuple[int, int]:
+    """
+    Validates one game, without raising any exception.
+
+    Args:
+        throwing_list: The number of pins knocked down at each throwing.
+        padding: The value used to pad the row, if any. The row ends at its first padding value.
+        partial: True if a game ending on a finished frame before the tenth one is valid.
+
+    Returns: The error code of the game and the offset of its first invalid throwing (-1 if the game is valid)
+    """
+    length = len(throwing_list)
+    if padding is not None:
+        for index in range(length):
+            if throwing_list[index] == padding:
+                length = index
+                break
+    index = 0
+    for frame_nb in range(1, 11):
+        if index == length:
+            return (VALID, -1) if partial else (UNFINISHED_FRAME, index)
+        first = throwing_list[index]
+        if first < 0:
+            return NEGATIVE_PINS, index
+        if first > 10:
+            return FRAME_OVERFLOW, index
+        index += 1
+        if first == 10 and frame_nb != 10:
+            continue
+        if index == length:
+            return UNFINISHED_FRAME, index
+        second = throwing_list[index]
+        if second < 0:
+            return NEGATIVE_PINS, index
+        if first == 10:
+            # Strike in the tenth frame: two bonus throwing on a new set of pins
+            if second > 10:
+                return TENTH_FRAME_BONUS, index
+            standing = 10 if second == 10 else 10 - second
+        elif first + second > 10:
+            return FRAME_OVERFLOW, index
+        elif first + second == 10 and frame_nb == 10:
+            # Spare in the tenth frame: one bonus throwing on a new set of pins
+            standing = 10
+        else:
+            index += 1
+            continue
+        index += 1
+        if index == length:
+            return UNFINISHED_FRAME, index
+        third = throwing_list[index]
+        if third < 0:
+            return NEGATIVE_PINS, index
+        if third > standing:
+            return TENTH_FRAME_BONUS, index
+        index += 1
+    if index != length:
+        return TOO_MANY_ROLLS, index
+    return VALID, -1
@@ -1,9 +1,48 @@
+import argparse
 import sys
 
-from bowling.game import BowlingGame
+from bowling.client import DEFAULT_SOCKET_PATH, DaemonClient
+from bowling.const import DEFAULT_CHUNK_SIZE
 
 if __name__ == '__main__':
-    throwing = []
-    if len(sys.argv) > 1:
-        throwing = [int(arg) for arg in sys.argv[1:]]
-    print(BowlingGame.computeScore(throwing))
+    parser = argparse.ArgumentParser(description="Computes the score of bowling games.")
+    parser.add_argument('throwing', nargs='*', type=int,
+                        help="The number of pins knocked down at each throwing of the game")
+    parser.add_argument('--stream', nargs='?', const='-', metavar='FILE',
+                        help="Scores one game per line of FILE (or of the standard input) and writes one score "
+                             "per line")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="The number of processes scoring the stream (0 to use all the cores)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="The number of games sent to a process at once (default: %(default)s)")
+    parser.add_argument('--daemon', metavar='PATH', default=DEFAULT_SOCKET_PATH,
+                        help="The Unix socket of the scoring daemon, used when it is running (default: %(default)s)")
+    parser.add_argument('--no-daemon', action='store_true', help="Computes the score without the scoring daemon")
+    args = parser.parse_args()
+    if args.workers < 0:
+        parser.error("--workers must be positive, or 0 to use all the cores")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+    if args.stream is None and not args.no_daemon:
+        try:
+            with DaemonClient(args.daemon) as client:
+                print(client.computeScore(args.throwing))
+            sys.exit(0)
+        except OSError:
+            pass  # The daemon is not running: the score is computed by this process
+
+    # The scoring code is only imported when the daemon cannot be used, to keep the calls to the daemon fast
+    from bowling.game import BowlingGame
+    from bowling.parallel import scoreParallel
+    from bowling.stream import BUFFER_SIZE, scoreStream
+
+    if args.stream is None:
+        print(BowlingGame.computeScore(args.throwing))
+    else:
+        games_file = sys.stdin if args.stream == '-' else open(args.stream, buffering=BUFFER_SIZE)
+        with games_file:
+            if args.workers == 1:
+                nb_errors = scoreStream(games_file, sys.stdout, sys.stderr)
+            else:
+                nb_errors = scoreParallel(games_file, sys.stdout, sys.stderr, args.chunk_size, args.workers or None)
+        sys.exit(1 if nb_errors > 0 else 0)
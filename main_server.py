@@ -0,0 +1,39 @@
+import argparse
+import asyncio
+import os
+import stat
+import sys
+
+from bowling.client import DEFAULT_SOCKET_PATH, isDaemonAvailable
+from bowling.server import ScoringServer
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Hosts many concurrent bowling games.")
+    parser.add_argument('--host', default='127.0.0.1', help="The host on which the server listens")
+    parser.add_argument('--port', type=int, default=8642, help="The TCP port on which the server listens")
+    parser.add_argument('--unix', metavar='PATH', help="Listens on the Unix socket at PATH instead of a TCP port")
+    parser.add_argument('--daemon', action='store_true',
+                        help="Runs as the scoring daemon used by main_score, on the Unix socket %s"
+                             % DEFAULT_SOCKET_PATH)
+    args = parser.parse_args()
+    if args.daemon:
+        args.unix = DEFAULT_SOCKET_PATH
+    if args.unix is not None and os.path.exists(args.unix):
+        if isDaemonAvailable(args.unix):
+            sys.exit("A scoring server is already listening on %s" % args.unix)
+        if not stat.S_ISSOCK(os.stat(args.unix).st_mode):
+            sys.exit("%s already exists and is not a socket" % args.unix)
+        try:
+            os.unlink(args.unix)  # Left behind by a server that did not stop cleanly
+        except OSError as error:
+            sys.exit("Cannot remove the socket left behind on %s: %s" % (args.unix, error))
+    loop = asyncio.new_event_loop()
+    server = ScoringServer()
+    loop.run_until_complete(server.start(args.host, args.port, args.unix))
+    try:
+        loop.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        loop.run_until_complete(server.stop())
+        loop.close()
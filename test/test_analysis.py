@@ -0,0 +1,84 @@
+from unittest import TestCase
+
+from bowling.analysis import computeExpectedScore, computeScoreDistribution, getStandingPins, nextState, \
+    FIRST_STATE, FINAL_STATE
+from bowling.game import BowlingGame
+
+
+def bruteForceDistribution(probabilities, throwing_list):
+    """
+    Computes the distribution of the final scores by enumerating all the possible games.
+    """
+    distribution = {}
+
+    def enumerate_games(state, throwing_list, probability):
+        if state == FINAL_STATE:
+            score = BowlingGame.computeScore(throwing_list)
+            distribution[score] = distribution.get(score, 0.0) + probability
+            return
+        standing = getStandingPins(state)
+        for nb_pins, pins_probability in probabilities[standing].items():
+            enumerate_games(nextState(state, nb_pins)[0], throwing_list + [nb_pins], probability * pins_probability)
+
+    state = FIRST_STATE
+    for nb_pins in throwing_list:
+        state = nextState(state, nb_pins)[0]
+    enumerate_games(state, list(throwing_list), 1.0)
+    return distribution
+
+
+class TestAnalysis(TestCase):
+    def test_deterministic(self):
+        """
+        Tests if a player always knocking down the same number of pins always gets the same score
+        """
+        self.assertEqual(computeScoreDistribution([0] * 10 + [1]), {300: 1.0})
+        self.assertEqual(computeScoreDistribution([1] + [0] * 10), {0: 1.0})
+        # Knocking down 5 pins on a full set, and thus 5 pins on the 5 remaining ones, is a game of spares
+        self.assertEqual(computeScoreDistribution([0] * 5 + [1] + [0] * 5), {150: 1.0})
+
+    def test_distribution(self):
+        """
+        Tests if the distribution is the same as the one obtained by enumerating all the games
+        """
+        pin_distribution = {standing: [1 / (standing + 1)] * (standing + 1) for standing in range(11)}
+        pin_distribution[10] = [0.3] + [0] * 8 + [0.3, 0.4]
+        pin_distribution[1] = [0.5, 0.5]
+        throwing_list = [10, 3, 7, 9, 0, 10, 10, 0, 0, 9, 1, 10]
+        expected = bruteForceDistribution({standing: {nb_pins: probability
+                                                      for nb_pins, probability in enumerate(probabilities)
+                                                      if probability > 0}
+                                           for standing, probabilities in pin_distribution.items()}, throwing_list)
+        distribution = computeScoreDistribution(pin_distribution, throwing_list)
+        self.assertEqual(list(distribution), sorted(expected))
+        for score, probability in expected.items():
+            self.assertAlmostEqual(distribution[score], probability)
+        self.assertAlmostEqual(sum(distribution.values()), 1)
+
+    def test_full_game(self):
+        """
+        Tests if the distribution of a whole game is a probability distribution
+        """
+        pin_distribution = [0.02, 0.02, 0.03, 0.03, 0.05, 0.05, 0.1, 0.1, 0.2, 0.2, 0.2]
+        distribution = computeScoreDistribution(pin_distribution)
+        self.assertAlmostEqual(sum(distribution.values()), 1)
+        self.assertEqual(min(distribution), 0)
+        self.assertEqual(max(distribution), 300)
+        self.assertAlmostEqual(distribution[300], 0.2 ** 12)
+        self.assertTrue(0 < computeExpectedScore(distribution) < 300)
+
+    def test_finished_game(self):
+        """
+        Tests if the distribution of a finished game is its score
+        """
+        self.assertEqual(computeScoreDistribution([0.5] + [0] * 9 + [0.5], [10] * 12), {300: 1.0})
+
+    def test_errors(self):
+        """
+        Tests if the good errors are raised for invalid distributions and games
+        """
+        self.assertRaises(ValueError, computeScoreDistribution, [0.5] * 11)
+        self.assertRaises(ValueError, computeScoreDistribution, [1.0] * 10)
+        self.assertRaises(ValueError, computeScoreDistribution, {10: [1.0]})
+        self.assertRaises(ValueError, computeScoreDistribution, [1.0] + [0] * 10, [6, 5])
+        self.assertRaises(ValueError, computeScoreDistribution, [1.0] + [0] * 10, [0] * 21)
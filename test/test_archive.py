@@ -0,0 +1,93 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from bowling.archive import ArchiveReader, ArchiveWriter, RECORD_SIZE
+from bowling.frame import PinsOverflowError
+from bowling.game import BowlingGame
+
+
+class TestArchive(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "games.bwl")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_write_read(self):
+        """
+        Tests if the games written in an archive are read back identically
+        """
+        games = [[10 for _ in range(12)], [3, 7, 5, 1], [], [5 for _ in range(21)]]
+        with ArchiveWriter(self.path) as writer:
+            writer.writeAll(games)
+        self.assertEqual(os.path.getsize(self.path), 16 + len(games) * RECORD_SIZE)
+        with ArchiveReader(self.path) as reader:
+            self.assertEqual(len(reader), len(games))
+            self.assertEqual([reader.getThrowing(i) for i in range(len(reader))], games)
+            self.assertEqual(len(reader[-1]), RECORD_SIZE)
+
+    def test_compute_scores(self):
+        """
+        Tests if the scores computed from the archive are the same as the ones computed by the game
+        """
+        games = [[10 for _ in range(12)], [2, 3, 6, 4, 8, 1, 10, 3, 0, 10, 10, 10, 10, 1, 9, 5],
+                 [5 for _ in range(21)], [0 for _ in range(20)], [3, 7, 5, 1], [3, 7], [10, 10], [], [9, 0] * 10,
+                 [10, 3, 7] * 3 + [4, 2, 10, 0, 10]] * 3
+        with ArchiveWriter(self.path) as writer:
+            writer.writeAll(games)
+        with ArchiveReader(self.path) as reader:
+            expected = [BowlingGame.computeScore(game) for game in games]
+            self.assertEqual(reader.computeScores(), expected)
+            self.assertEqual(reader.computeScores(10, 20), expected[10:20])
+            # The bounds behave as the bounds of a slice, and never reach the header
+            for start, stop in [(-1, None), (-5, -2), (-100, 3), (25, 1000), (20, 10), (100, None)]:
+                self.assertEqual(reader.computeScores(start, stop), expected[start:stop])
+            self.assertEqual(reader.computeScore(5), expected[5])
+
+    def test_close_with_records(self):
+        """
+        Tests if the archive can be closed while records obtained from it are still referenced
+        """
+        with ArchiveWriter(self.path) as writer:
+            writer.writeAll([[3, 7, 5, 1], [10, 10]])
+        with ArchiveReader(self.path) as reader:
+            for record in reader:
+                pass
+            first = reader[0]
+        self.assertEqual(bytes(first[:4]), bytes([3, 7, 5, 1]))
+        self.assertEqual(bytes(record[:2]), bytes([10, 10]))
+        reader.close()
+        self.assertRaises(ValueError, reader.computeScore, 0)
+
+    def test_compute_score_errors(self):
+        """
+        Tests if the good error is raised when an archived game is not valid
+        """
+        with ArchiveWriter(self.path) as writer:
+            writer.write([3])
+            writer.write([8, 8])
+        with ArchiveReader(self.path) as reader:
+            self.assertRaises(ValueError, reader.computeScore, 0)
+            self.assertRaises(PinsOverflowError, reader.computeScore, 1)
+            self.assertRaises(IndexError, reader.computeScore, 2)
+
+    def test_write_errors(self):
+        """
+        Tests if the games that cannot be stored are rejected
+        """
+        with ArchiveWriter(self.path) as writer:
+            self.assertRaises(ValueError, writer.write, [1] * 22)
+            self.assertRaises(ValueError, writer.write, [-1])
+            self.assertRaises(ValueError, writer.write, [255])
+        with ArchiveReader(self.path) as reader:
+            self.assertEqual(len(reader), 0)
+
+    def test_not_an_archive(self):
+        """
+        Tests if the good error is raised when the file is not an archive
+        """
+        with open(self.path, 'wb') as invalid_file:
+            invalid_file.write(b'3 7 5 1\n' * 4)
+        self.assertRaises(ValueError, ArchiveReader, self.path)
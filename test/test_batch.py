@@ -0,0 +1,76 @@
+import random
+from unittest import TestCase
+
+from bowling.batch import computeRowScore, computeScores
+from bowling.frame import PinsOverflowError
+from bowling.game import BowlingGame
+
+
+def randomGame(rng: random.Random, nb_frames: int = 10):
+    """
+    Generates the throwing of a random (valid) game of the given number of frames.
+    """
+    throwing = []
+    for frame_nb in range(1, nb_frames + 1):
+        first = rng.randint(0, 10)
+        throwing.append(first)
+        if frame_nb == 10:
+            second = rng.randint(0, 10) if first == 10 else rng.randint(0, 10 - first)
+            throwing.append(second)
+            if first + second >= 10:
+                throwing.append(rng.randint(0, 10))
+        elif first != 10:
+            throwing.append(rng.randint(0, 10 - first))
+    return throwing
+
+
+class TestBatch(TestCase):
+    def test_compute_scores(self):
+        """
+        Tests if the scores of several games are computed correctly
+        """
+        games = [[10 for _ in range(12)],
+                 [2, 3, 6, 4, 8, 1, 10, 3, 0, 10, 10, 10, 10, 1, 9, 5],
+                 [5 for _ in range(21)],
+                 [0 for _ in range(20)]]
+        self.assertEqual(computeScores(games), [300, 164, 150, 0])
+
+    def test_compute_scores_padded(self):
+        """
+        Tests if the padding of the rows is ignored
+        """
+        games = [[10] * 12 + [-1] * 9,
+                 [3, 7, 5, 1] + [-1] * 17,
+                 [3, 7] + [-1] * 19]
+        self.assertEqual(computeScores(games, padding=-1), [300, 21, None])
+
+    def test_compute_scores_zero_padded(self):
+        """
+        Tests if the throwing after the tenth frame are ignored
+        """
+        games = [[1, 2] * 10 + [0], [10] * 12 + [0] * 9]
+        self.assertEqual(computeScores(games), [30, 300])
+
+    def test_same_as_compute_score(self):
+        """
+        Tests if the batch scoring gives the same results as the frame-based scoring, partial games included
+        """
+        rng = random.Random(42)
+        games = [randomGame(rng, rng.randint(0, 10)) for _ in range(500)]
+        self.assertEqual(BowlingGame.computeScores(games), [BowlingGame.computeScore(game) for game in games])
+
+    def test_same_errors_as_compute_score(self):
+        """
+        Tests if the batch scoring raises the same errors as the frame-based scoring
+        """
+        for throwing, error in (([2, 3, 6], ValueError), ([10] * 11, ValueError), ([1, -1], ValueError),
+                                ([6, 5], PinsOverflowError), ([11], PinsOverflowError)):
+            self.assertRaises(error, BowlingGame.computeScore, throwing)
+            self.assertRaises(error, computeRowScore, throwing)
+
+    def test_ending_frame_without_overflow(self):
+        """
+        Tests if the ending frame keeps the same semantic as BowlingFrame, which does not check for overflows
+        """
+        throwing = [0] * 18 + [5, 9, 3]
+        self.assertEqual(computeRowScore(throwing), BowlingGame.computeScore(throwing))
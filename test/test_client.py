@@ -0,0 +1,76 @@
+import asyncio
+import os
+import tempfile
+import threading
+from unittest import TestCase, mock
+
+from bowling.client import DaemonClient, _defaultSocketPath, isDaemonAvailable
+from bowling.server import ScoringServer
+
+
+class TestDaemonClient(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "daemon.sock")
+        self.loop = asyncio.new_event_loop()
+        self.server = ScoringServer()
+        self.loop.run_until_complete(self.server.start(path=self.path))
+        self.thread = threading.Thread(target=self.loop.run_forever)
+        self.thread.start()
+
+    def tearDown(self):
+        asyncio.run_coroutine_threadsafe(self.server.stop(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+        self.directory.cleanup()
+
+    def test_compute_score(self):
+        """
+        Tests if the daemon computes the same scores as the game, on a single connection
+        """
+        with DaemonClient(self.path) as client:
+            self.assertEqual(client.computeScore([10 for _ in range(12)]), 300)
+            self.assertEqual(client.computeScore([2, 3, 6, 4, 8, 1, 10, 3, 0, 10, 10, 10, 10, 1, 9, 5]), 164)
+            self.assertEqual(client.computeScore([3, 7]), None)
+            self.assertEqual(client.computeScore([]), 0)
+
+    def test_errors(self):
+        """
+        Tests if the errors of the daemon are raised by the client without closing the connection
+        """
+        with DaemonClient(self.path) as client:
+            self.assertRaises(ValueError, client.computeScore, [2, 3, 6])
+            self.assertRaises(ValueError, client.computeScore, [6, 5])
+            self.assertEqual(client.computeScore([3, 7, 5, 1]), 21)
+
+    def test_availability(self):
+        """
+        Tests if the availability of the daemon is detected
+        """
+        self.assertTrue(isDaemonAvailable(self.path))
+        self.assertFalse(isDaemonAvailable(os.path.join(self.directory.name, "missing.sock")))
+        self.assertRaises(OSError, DaemonClient, os.path.join(self.directory.name, "missing.sock"))
+
+    def test_socket_of_another_user(self):
+        """
+        Tests if a socket that belongs to another user is not trusted
+        """
+        with mock.patch('os.getuid', return_value=os.stat(self.path).st_uid + 1):
+            self.assertRaises(PermissionError, DaemonClient, self.path)
+            self.assertFalse(isDaemonAvailable(self.path))
+
+    def test_default_socket_path(self):
+        """
+        Tests if the default socket of the daemon is specific to the current user
+        """
+        with mock.patch.dict(os.environ, {'BOWLING_DAEMON_SOCKET': '/run/bowling.sock'}):
+            self.assertEqual(_defaultSocketPath(), '/run/bowling.sock')
+        with mock.patch.dict(os.environ, {'XDG_RUNTIME_DIR': '/run/user/1000'}):
+            os.environ.pop('BOWLING_DAEMON_SOCKET', None)
+            self.assertEqual(_defaultSocketPath(), '/run/user/1000/bowling-daemon.sock')
+        with mock.patch.dict(os.environ, {}):
+            os.environ.pop('BOWLING_DAEMON_SOCKET', None)
+            os.environ.pop('XDG_RUNTIME_DIR', None)
+            self.assertEqual(_defaultSocketPath(),
+                             os.path.join(tempfile.gettempdir(), 'bowling-daemon-%d.sock' % os.getuid()))
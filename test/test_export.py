@@ -0,0 +1,74 @@
+import os
+import tempfile
+import zipfile
+from unittest import TestCase
+
+from bowling.export import ColumnarExporter, readColumns
+from bowling.game import BowlingGame
+
+
+class TestColumnarExporter(TestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.path = os.path.join(directory, "frames.npz")
+        self.addCleanup(os.rmdir, directory)
+        self.addCleanup(lambda: os.path.exists(self.path) and os.remove(self.path))
+
+    def test_columns(self):
+        """
+        Tests if each frame of each player gives one row with its throwing, its score and its kind
+        """
+        game = BowlingGame(["Alice", "Bob"])
+        for nb_pins in [10] * 12:
+            game.registerRoll("Alice", nb_pins)
+        for nb_pins in [3, 7, 5, 1, 10, 2]:
+            game.registerRoll("Bob", nb_pins)
+        with ColumnarExporter(self.path) as exporter:
+            exporter.addGame(game, game_id=42)
+        columns = readColumns(self.path)
+        self.assertEqual(columns['players'], ["Alice", "Bob"])
+        self.assertEqual(columns['player'], [0] * 10 + [1] * 4)
+        self.assertEqual(columns['game_id'], [42] * 14)
+        self.assertEqual(columns['frame'], list(range(1, 11)) + [1, 2, 3, 4])
+        self.assertEqual(columns['roll1'], [10] * 10 + [3, 5, 10, 2])
+        self.assertEqual(columns['roll2'], [-1] * 9 + [10, 7, 1, -1, -1])
+        self.assertEqual(columns['roll3'], [-1] * 9 + [10, -1, -1, -1, -1])
+        self.assertEqual(columns['score'], list(range(30, 301, 30)) + [15, 21, -1, -1])
+        self.assertEqual(columns['strike'], [True] * 10 + [False, False, True, False])
+        self.assertEqual(columns['spare'], [False] * 10 + [True, False, False, False])
+        self.assertEqual(columns['open'], [False] * 10 + [False, True, False, False])
+
+    def test_chunks(self):
+        """
+        Tests if writing the rows in small chunks gives the same file as writing them at once
+        """
+        games = []
+        for throwing_list in [[5] * 21, [10] * 12, [2, 3] * 10]:
+            game = BowlingGame(["A"])
+            for nb_pins in throwing_list:
+                game.registerRoll("A", nb_pins)
+            games.append(game)
+        with ColumnarExporter(self.path, chunk_size=1) as exporter:
+            for game in games:
+                exporter.addGame(game)
+        chunked_columns = readColumns(self.path)
+        with ColumnarExporter(self.path) as exporter:
+            for game in games:
+                exporter.addGame(game)
+        self.assertEqual(readColumns(self.path), chunked_columns)
+        self.assertEqual(exporter.nbRows, 30)
+        self.assertEqual(chunked_columns['game_id'], [0] * 10 + [1] * 10 + [2] * 10)
+        self.assertEqual(chunked_columns['score'][9::10], [150, 300, 50])
+
+    def test_npy_headers(self):
+        """
+        Tests if each column is stored as a .npy file whose data starts on a multiple of 64 bytes
+        """
+        with ColumnarExporter(self.path) as exporter:
+            exporter.addGame(BowlingGame(["A"]))
+        with zipfile.ZipFile(self.path) as npz_file:
+            for entry in npz_file.namelist():
+                data = npz_file.read(entry)
+                self.assertTrue(data.startswith(b'\x93NUMPY\x01\x00'))
+                self.assertEqual((10 + int.from_bytes(data[8:10], 'little')) % 64, 0)
+        self.assertEqual(readColumns(self.path)['player'], [])
@@ -308,6 +308,59 @@ class TestBowlingFrame(TestCase):
         frame.registerThrowing(9)
         self.assertRaises(PinsOverflowError, frame.registerThrowing, 3)
 
+    def test_too_much_pins_error_keeps_frame(self):
+        """
+        Checks if a throwing rejected because of too much pins leaves the frame unchanged
+        """
+        frame = BowlingFrame("test")
+        frame.registerThrowing(9)
+        self.assertRaises(PinsOverflowError, frame.registerThrowing, 3)
+        self.assertEqual(frame.getThrowing(), (9,))
+        self.assertEqual(frame.getNbOfKnockedDownPins(), 9)
+        frame.registerThrowing(1)
+        self.assertTrue(frame.isSpare())
+        self.assertEqual(frame.getNbOfKnockedDownPins(), 10)
+
+    def test_slots(self):
+        """
+        Checks that the frame does not carry a per-instance dictionary
+        """
+        frame = BowlingFrame("test")
+        self.assertFalse(hasattr(frame, '__dict__'))
+        self.assertRaises(AttributeError, setattr, frame, 'unknown', 0)
+
+    def test_replace_throwing(self):
+        """
+        Checks if a throwing can be corrected as long as the frame keeps the same number of throwing
+        """
+        frame = BowlingFrame("test")
+        frame.registerThrowing(3)
+        frame.registerThrowing(4)
+        self.assertEqual(frame.getScore(), 7)
+        frame.replaceThrowing(0, 5)
+        self.assertEqual(frame.getThrowing(), (5, 4))
+        self.assertEqual(frame.getScore(), 9)
+        frame.replaceThrowing(1, 5)
+        self.assertTrue(frame.isSpare())
+        self.assertIsNone(frame.getScore())
+        self.assertRaises(PinsOverflowError, frame.replaceThrowing, 1, 6)
+        # A strike would finish the frame before its second throwing
+        self.assertRaises(ValueError, frame.replaceThrowing, 0, 10)
+        self.assertRaises(ValueError, frame.replaceThrowing, 2, 1)
+        self.assertEqual(frame.getThrowing(), (5, 5))
+
+    def test_replace_throwing_ending(self):
+        """
+        Checks if the correction of an ending frame cannot remove its bonus throwing
+        """
+        frame = BowlingFrame("test", ending=True)
+        for nb_pins in [10, 3, 4]:
+            frame.registerThrowing(nb_pins)
+        frame.replaceThrowing(0, 9)
+        self.assertEqual(frame.getScore(), 16)
+        self.assertRaises(ValueError, frame.replaceThrowing, 1, 0)
+        self.assertEqual(frame.getThrowing(), (9, 3, 4))
+
     def test_negative_pins_error(self):
         """
         Checks if the good error is raised when a negative number of pins is passed
@@ -315,6 +368,21 @@ class TestBowlingFrame(TestCase):
         frame = BowlingFrame("test")
         self.assertRaises(ValueError, frame.registerThrowing, -1)
 
+    def test_marks(self):
+        """
+        Checks if the marks of the throwing are the ones displayed by the string representation
+        """
+        frame = BowlingFrame("test")
+        self.assertEqual(frame.getMarks(), (' ', ' '))
+        frame.registerThrowing(3)
+        frame.registerThrowing(7)
+        self.assertEqual(frame.getMarks(), ('3', '/'))
+        frame = BowlingFrame("test", ending=True)
+        for nb_pins in [10, 10, 4]:
+            frame.registerThrowing(nb_pins)
+        self.assertEqual(frame.getMarks(), ('X', 'X', '4'))
+        self.assertEqual(frame.__str__(), '| |X|X|4|')
+
     def test_str_hole(self):
         """
         Checks if the string representation of the frame is correct for a hole
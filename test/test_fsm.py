@@ -0,0 +1,82 @@
+import random
+from unittest import TestCase
+
+from bowling.frame import PinsOverflowError
+from bowling.fsm import computeScore, FINAL_STATE, NB_COLUMNS, OVERFLOW, STATES, TRANSITIONS, WEIGHTS
+from bowling.game import BowlingGame
+
+
+def scoreOrError(throwing_list, engine):
+    """
+    Gives the score of the throwing with the given engine, or the type of the error it raises.
+    """
+    try:
+        return BowlingGame.computeScore(throwing_list, engine=engine)
+    except (ValueError, PinsOverflowError) as error:
+        return type(error)
+
+
+class TestFsm(TestCase):
+    def test_compute_score(self):
+        """
+        Tests if the scores of typical games are computed correctly
+        """
+        self.assertEqual(computeScore([10 for _ in range(12)]), 300)
+        self.assertEqual(computeScore([2, 3, 6, 4, 8, 1, 10, 3, 0, 10, 10, 10, 10, 1, 9, 5]), 164)
+        self.assertEqual(computeScore([5 for _ in range(21)]), 150)
+        self.assertEqual(computeScore([]), 0)
+        self.assertEqual(computeScore([3, 7, 5, 1]), 21)
+        self.assertIsNone(computeScore([3, 7]))
+        self.assertIsNone(computeScore([10, 10, 3, 4, 10]))
+
+    def test_tenth_frame_rules(self):
+        """
+        Tests if the ending frame keeps its rules: a third throwing from 10 knocked down pins, and no overflow
+        """
+        self.assertEqual(computeScore([0] * 18 + [3, 8, 12]), 23)
+        self.assertEqual(computeScore([0] * 18 + [15, 2, 1]), 18)
+        self.assertEqual(computeScore([0] * 18 + [3, 4, 5]), 7)
+        self.assertRaises(ValueError, computeScore, [0] * 18 + [10, 2])
+
+    def test_errors(self):
+        """
+        Tests if the errors are the same as the ones of the frames
+        """
+        self.assertRaises(PinsOverflowError, computeScore, [6, 5])
+        self.assertRaises(PinsOverflowError, computeScore, [11])
+        self.assertRaises(ValueError, computeScore, [3, -1])
+        self.assertRaises(ValueError, computeScore, [3, 4, 5])
+        self.assertRaises(ValueError, BowlingGame.computeScore, [3, 4], engine='unknown')
+
+    def test_tables(self):
+        """
+        Tests if the tables have one transition per state and column, and if the final state cannot be left
+        """
+        self.assertEqual(len(TRANSITIONS), len(STATES) * NB_COLUMNS)
+        self.assertEqual(len(WEIGHTS), len(STATES))
+        final_index = STATES.index(FINAL_STATE)
+        self.assertEqual(set(TRANSITIONS[final_index * NB_COLUMNS:(final_index + 1) * NB_COLUMNS]), {OVERFLOW})
+        self.assertEqual(max(WEIGHTS), 3)
+
+    def test_same_as_frames(self):
+        """
+        Tests if the finite-state machine gives the same scores and errors as the frames, on random throwing
+        """
+        rng = random.Random(23)
+        for _ in range(3000):
+            throwing_list = [rng.choice([rng.randint(0, 10), rng.randint(0, 5), rng.randint(-1, 12)])
+                             for _ in range(rng.randint(0, 23))]
+            self.assertEqual(scoreOrError(throwing_list, 'fsm'), scoreOrError(throwing_list, 'frames'),
+                             throwing_list)
+        for _ in range(1000):
+            # Valid games, cut anywhere
+            throwing_list = []
+            for frame_nb in range(1, 11):
+                first = rng.randint(0, 10)
+                second = rng.randint(0, 10 if frame_nb == 10 and first == 10 else 10 - first)
+                throwing_list += [first] if first == 10 and frame_nb != 10 else [first, second]
+                if frame_nb == 10 and first + second >= 10:
+                    throwing_list.append(rng.randint(0, 10))
+            throwing_list = throwing_list[:rng.randint(0, len(throwing_list))]
+            self.assertEqual(scoreOrError(throwing_list, 'fsm'), scoreOrError(throwing_list, 'frames'),
+                             throwing_list)
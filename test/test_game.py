@@ -1,10 +1,18 @@
 from unittest import TestCase
 
-from bowling.frame import BowlingFrame
+from bowling.frame import BowlingFrame, PinsOverflowError
 from bowling.game import BowlingGame
 
 
 class TestBowlingGame(TestCase):
+    def test_duplicated_names(self):
+        """
+        Tests if each duplicated name gets its own suffix
+        """
+        game = BowlingGame(["A", "B", "A", "A", "B"])
+        self.assertEqual(game.players, ["A", "B", "A_2", "A_3", "B_2"])
+        self.assertEqual(BowlingGame(["A", "A_2", "A"]).players, ["A", "A_2", "A_3"])
+
     def test_compute_max_score_on_frames(self):
         """
         Tests if the maximum score is computed correctly
@@ -116,6 +124,25 @@ class TestBowlingGame(TestCase):
         frames.append(frame)  # Strike
         self.assertEqual(BowlingGame.computeScoreOnFrames(frames), None)
 
+    def test_compute_score_on_long_session(self):
+        """
+        Tests if the score is computed correctly on a session longer than a regular game
+        """
+        frames = []
+        for i in range(3000):
+            frame = BowlingFrame("test")
+            if i % 3 == 0:
+                frame.registerThrowing(10)  # Strike
+            elif i % 3 == 1:
+                frame.registerThrowing(6)
+                frame.registerThrowing(4)  # Spare
+            else:
+                frame.registerThrowing(3)
+                frame.registerThrowing(4)
+            frames.append(frame)
+        # Each group of three frames is worth 20 + 13 + 7 points
+        self.assertEqual(BowlingGame.computeScoreOnFrames(frames), 1000 * 40)
+
     def test_compute_max_score(self):
         """
         Tests if the maximum score is computed correctly without frames
@@ -172,3 +199,186 @@ class TestBowlingGame(TestCase):
         self.assertEqual(len(game.frames['test']), 10)
         self.assertEqual(BowlingGame.computeScoreOnFrames(game.frames['test']), 164)
 
+    def test_register_roll(self):
+        """
+        Tests if registering throwing one by one returns the frames whose score changed
+        """
+        game = BowlingGame(['test', 'other'])
+        self.assertEqual(game.registerRoll('test', 10), [])
+        self.assertEqual(game.registerRoll('test', 10), [])
+        self.assertEqual(game.registerRoll('other', 3), [])
+        changed = game.registerRoll('test', 4)
+        self.assertEqual(changed, [game.frames['test'][0]])
+        self.assertEqual(changed[0].getScore(), 24)
+        changed = game.registerRoll('test', 5)
+        self.assertEqual(changed, game.frames['test'][1:3])
+        self.assertEqual([frame.getScore() for frame in changed], [43, 52])
+        self.assertEqual(game.scores, {'test': 52, 'other': 0})
+        self.assertEqual(len(game.frames['other']), 1)
+
+    def test_register_roll_full_game(self):
+        """
+        Tests if registering throwing one by one gives the same score as the play
+        """
+        game = BowlingGame(['test'])
+        for nb_pins in [2, 3, 6, 4, 8, 1, 10, 3, 0, 10, 10, 10, 10, 1, 9, 5]:
+            game.registerRoll('test', nb_pins)
+        self.assertEqual(len(game.frames['test']), 10)
+        self.assertEqual(game.frames['test'][-1].getScore(), 164)
+        self.assertEqual(game.scores['test'], 164)
+        self.assertRaises(ValueError, game.registerRoll, 'test', 3)
+
+    def test_correct_throwing(self):
+        """
+        Tests if correcting a throwing gives the same scores as replaying the corrected game
+        """
+        throwing_list = [2, 3, 6, 4, 8, 1, 10, 3, 0, 10, 10, 10, 10, 1, 9, 5]
+        corrections = [(0, 0, 5, 0), (1, 1, 3, 3), (2, 1, 2, 5), (4, 1, 7, 8), (9, 2, 0, 15), (9, 0, 4, 13)]
+        for frame_index, throwing_index, nb_pins, position in corrections:
+            game = BowlingGame(['test'])
+            for pins in throwing_list:
+                game.registerRoll('test', pins)
+            game.correctThrowing('test', frame_index, throwing_index, nb_pins)
+            corrected_list = list(throwing_list)
+            corrected_list[position] = nb_pins
+            replayed_game = BowlingGame(['test'])
+            for pins in corrected_list:
+                replayed_game.registerRoll('test', pins)
+            self.assertEqual([frame.getThrowing() for frame in game.frames['test']],
+                             [frame.getThrowing() for frame in replayed_game.frames['test']])
+            self.assertEqual([frame.getScore() for frame in game.frames['test']],
+                             [frame.getScore() for frame in replayed_game.frames['test']])
+            self.assertEqual(game.scores, replayed_game.scores)
+
+    def test_correct_throwing_in_progress(self):
+        """
+        Tests if a correction in a game in progress returns the frames whose score changed
+        """
+        game = BowlingGame(['test'])
+        for nb_pins in [3, 4, 5, 2, 10, 1]:
+            game.registerRoll('test', nb_pins)
+        changed = game.correctThrowing('test', 1, 1, 5)
+        self.assertEqual(changed, [game.frames['test'][1]])
+        self.assertEqual([frame.getScore() for frame in game.frames['test']], [7, 27, None, None])
+        self.assertEqual(game.scores['test'], 27)
+        self.assertRaises(ValueError, game.correctThrowing, 'test', 4, 0, 3)
+        self.assertRaises(ValueError, game.correctThrowing, 'test', 2, 0, 9)
+        self.assertRaises(ValueError, game.correctThrowing, 'unknown', 0, 0, 3)
+        # The ending frame in progress keeps waiting for its throwing
+        game = BowlingGame(['test'])
+        for nb_pins in [3, 4] * 9 + [10]:
+            game.registerRoll('test', nb_pins)
+        game.correctThrowing('test', 8, 0, 6)
+        self.assertIsNone(game.frames['test'][9].getScore())
+        self.assertEqual(game.scores['test'], 76)
+        game.registerRoll('test', 10)
+        game.registerRoll('test', 10)
+        self.assertEqual(game.scores['test'], 106)
+
+    def test_lazy_scores(self):
+        """
+        Tests if the scores of a lazy game are only computed when they are read
+        """
+        game = BowlingGame(['test'], lazy=True)
+        for nb_pins in [10, 3, 4]:
+            self.assertEqual(game.registerRoll('test', nb_pins), [])
+        frames = game.frames['test']
+        self.assertIsNone(frames[0]._score)
+        self.assertEqual(game.scores['test'], 0)
+        self.assertEqual(frames[1].getScore(), 24)
+        self.assertEqual(frames[0]._score, 17)
+        self.assertEqual(game.scores['test'], 24)
+        self.assertRaises(PinsOverflowError, game.registerRoll, 'test', 11)
+        self.assertEqual(len(frames), 2)
+
+    def test_lazy_same_as_eager(self):
+        """
+        Tests if a lazy game gives the same scores, bounds, corrections and rendering as an eager one
+        """
+        throwing_list = [2, 3, 6, 4, 8, 1, 10, 3, 0, 10, 10, 10, 10, 1, 9, 5]
+        for read_every in [1, 2, 5, 100]:
+            lazy_game = BowlingGame(['test', 'other'], lazy=True)
+            game = BowlingGame(['test', 'other'])
+            for index, nb_pins in enumerate(throwing_list):
+                for player in game.players:
+                    lazy_game.registerRoll(player, nb_pins)
+                    game.registerRoll(player, nb_pins)
+                if index % read_every == 0:
+                    self.assertEqual(lazy_game.getScoreBounds('test'), game.getScoreBounds('test'))
+                    self.assertEqual(lazy_game.getScore('other'), game.scores['other'])
+            self.assertEqual(str(lazy_game), str(game))
+            self.assertEqual([frame.getScore() for frame in lazy_game.frames['other']],
+                             [frame.getScore() for frame in game.frames['other']])
+            lazy_game.correctThrowing('test', 4, 1, 7)
+            game.correctThrowing('test', 4, 1, 7)
+            self.assertEqual(lazy_game.getScore('test'), game.getScore('test'))
+            self.assertEqual(str(lazy_game), str(game))
+
+    def test_register_roll_errors(self):
+        """
+        Tests if an invalid throwing is rejected without changing the game
+        """
+        game = BowlingGame(['test'])
+        self.assertRaises(ValueError, game.registerRoll, 'unknown', 3)
+        self.assertRaises(ValueError, game.registerRoll, 'test', -1)
+        self.assertEqual(game.frames['test'], [])
+        game.registerRoll('test', 7)
+        self.assertRaises(PinsOverflowError, game.registerRoll, 'test', 4)
+        self.assertEqual(game.frames['test'][0].getThrowing(), (7,))
+
+    def test_score_bounds(self):
+        """
+        Tests if the score bounds are correct after each throwing of a game
+        """
+        game = BowlingGame(['test'])
+        self.assertEqual(game.getScoreBounds('test'), (0, 300))
+        bounds = []
+        for nb_pins in [10, 10, 3, 7, 4, 2]:
+            game.registerRoll('test', nb_pins)
+            bounds.append(game.getScoreBounds('test'))
+        self.assertEqual(bounds, [(10, 300), (30, 300), (39, 273), (53, 273), (61, 257), (63, 243)])
+
+    def test_score_bounds_exhaustive(self):
+        """
+        Tests if the score bounds are the minimum and maximum of all the possible endings of partial games
+        """
+        def completions(frame_nb, throwing):
+            # All the possible throwing of the frames from frame_nb to the tenth, given the throwing of frame_nb
+            if frame_nb == 11:
+                yield ()
+                return
+            if frame_nb < 10:
+                if len(throwing) == 1 and throwing[0] == 10 or len(throwing) == 2:
+                    yield from completions(frame_nb + 1, ())
+                    return
+                standing = 10 - sum(throwing)
+                for nb_pins in range(standing + 1):
+                    for ending in completions(frame_nb, throwing + (nb_pins,)):
+                        yield (nb_pins,) + ending
+                return
+            if len(throwing) == 3 or (len(throwing) == 2 and sum(throwing) < 10):
+                yield ()
+                return
+            if len(throwing) == 0 or throwing[-1] == 10 or (len(throwing) == 2 and sum(throwing) == 10):
+                standing = 10
+            else:
+                standing = 10 - throwing[-1]
+            for nb_pins in range(standing + 1):
+                for ending in completions(frame_nb, throwing + (nb_pins,)):
+                    yield (nb_pins,) + ending
+
+        beginnings = [[0] * 16, [0] * 14 + [10, 10], [0] * 14 + [10, 5, 5], [0] * 14 + [10, 10, 10], [0] * 16 + [3],
+                      [0] * 16 + [10], [0] * 16 + [10, 10, 10], [0] * 16 + [6, 4, 10], [0] * 16 + [6, 4, 3],
+                      [0] * 16 + [10, 10, 10, 10], [0] * 16 + [10, 10, 10, 3], [0] * 18 + [10, 3],
+                      [0] * 18 + [10, 10], [0] * 18 + [5, 5], [0] * 18 + [5]]
+        for beginning in beginnings:
+            game = BowlingGame(['test'])
+            for nb_pins in beginning:
+                game.registerRoll('test', nb_pins)
+            frames = game.frames['test']
+            if frames[-1].isFinished:
+                frame_nb, throwing = len(frames) + 1, ()
+            else:
+                frame_nb, throwing = len(frames), frames[-1].getThrowing()
+            scores = [BowlingGame.computeScore(beginning + list(ending)) for ending in completions(frame_nb, throwing)]
+            self.assertEqual(game.getScoreBounds('test'), (min(scores), max(scores)), beginning)
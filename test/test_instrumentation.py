@@ -0,0 +1,69 @@
+from unittest import TestCase
+
+from bowling import instrumentation
+from bowling.frame import BowlingFrame
+from bowling.game import BowlingGame
+
+
+class TestInstrumentation(TestCase):
+    def setUp(self):
+        instrumentation.reset()
+
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def test_disabled_by_default(self):
+        """
+        Tests if the methods are left untouched while the instrumentation is disabled
+        """
+        original = BowlingFrame.__dict__['registerThrowing']
+        self.assertFalse(instrumentation.isEnabled())
+        instrumentation.enable()
+        self.assertIsNot(BowlingFrame.__dict__['registerThrowing'], original)
+        instrumentation.disable()
+        self.assertIs(BowlingFrame.__dict__['registerThrowing'], original)
+        self.assertIsInstance(BowlingGame.__dict__['_informPreviousFrames'], staticmethod)
+
+    def test_count_calls(self):
+        """
+        Tests if the calls of the instrumented methods are counted while the instrumentation is enabled
+        """
+        game = BowlingGame(['test'])
+        instrumentation.enable()
+        instrumentation.enable()  # Enabling twice does not count the calls twice
+        for nb_pins in [3, 7, 5, 1]:
+            game.registerRoll('test', nb_pins)
+        str(game)
+        instrumentation.disable()
+        game.registerRoll('test', 3)
+        stats = instrumentation.getStats()
+        self.assertEqual(stats['BowlingFrame.registerThrowing']['calls'], 4)
+        self.assertEqual(stats['BowlingGame._informPreviousFrames']['calls'], 4)
+        self.assertEqual(stats['BowlingGame.__str__']['calls'], 1)
+        self.assertEqual(stats['ScoreboardRenderer.render']['calls'], 1)
+        self.assertEqual(stats['BowlingFrame.__str__']['calls'], 4)
+        self.assertGreater(stats['BowlingFrame.computeScore']['calls'], 0)
+        self.assertGreaterEqual(stats['BowlingFrame.registerThrowing']['seconds'], 0)
+        self.assertEqual(game.frames['test'][1].getScore(), 21)
+
+    def test_count_errors(self):
+        """
+        Tests if the calls raising an error are counted too
+        """
+        instrumentation.enable()
+        frame = BowlingFrame("test")
+        self.assertRaises(ValueError, frame.registerThrowing, -1)
+        self.assertEqual(instrumentation.getStats()['BowlingFrame.registerThrowing']['calls'], 1)
+
+    def test_prometheus(self):
+        """
+        Tests if the statistics are exported in the Prometheus text format
+        """
+        instrumentation.enable()
+        BowlingGame.computeScore([3, 7, 5, 1])
+        exported = instrumentation.toPrometheus()
+        self.assertIn("# TYPE bowling_calls_total counter\n", exported)
+        self.assertIn('bowling_calls_total{method="BowlingFrame.registerThrowing"} 4\n', exported)
+        self.assertIn('bowling_call_seconds_total{method="BowlingFrame.computeScore"} ', exported)
+        self.assertTrue(exported.endswith("\n"))
@@ -0,0 +1,120 @@
+import os
+import shutil
+import stat
+import tempfile
+from unittest import TestCase, mock
+
+from bowling.journal import GameJournal, LOG_NAME, SNAPSHOT_NAME
+
+
+def getBoard(journal):
+    """
+    Gives the throwing and scores of every game of a journal.
+    """
+    return {game_id: {player: [(frame.getThrowing(), frame.getScore()) for frame in frames]
+                      for player, frames in game.frames.items()}
+            for game_id, game in journal.games.items()}
+
+
+class TestGameJournal(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def playGames(self, journal):
+        """
+        Plays two games in the journal, finishing and closing a third one.
+        """
+        first = journal.openGame(["A", "B"])
+        second = journal.openGame(["C"])
+        third = journal.openGame(["D"])
+        for nb_pins in [10, 10, 3, 7, 4]:
+            journal.registerRoll(first, "A", nb_pins)
+        for nb_pins in [5, 5, 2]:
+            journal.registerRoll(first, "B", nb_pins)
+            journal.registerRoll(second, "C", nb_pins)
+        for nb_pins in [10] * 12:
+            journal.registerRoll(third, "D", nb_pins)
+        journal.closeGame(third)
+
+    def test_recover(self):
+        """
+        Tests if the games are recovered from the log
+        """
+        with GameJournal(self.directory, events_per_sync=4) as journal:
+            self.playGames(journal)
+            board = getBoard(journal)
+        self.assertFalse(os.path.exists(os.path.join(self.directory, SNAPSHOT_NAME)))
+        with GameJournal(self.directory) as recovered_journal:
+            self.assertEqual(getBoard(recovered_journal), board)
+            self.assertEqual(sorted(recovered_journal.games), [1, 2])
+            self.assertEqual(recovered_journal.openGame(["E"]), 4)
+
+    def test_snapshot(self):
+        """
+        Tests if the recovery starts from the snapshot, and only replays the events written after it
+        """
+        with GameJournal(self.directory, events_per_sync=1, events_per_snapshot=10) as journal:
+            self.playGames(journal)
+            board = getBoard(journal)
+        log_path = os.path.join(self.directory, LOG_NAME)
+        with open(os.path.join(self.directory, SNAPSHOT_NAME)) as snapshot_file:
+            offset = int(snapshot_file.read().split('"offset":')[1].split(',')[0])
+        self.assertGreater(offset, 0)
+        # The events included in the snapshot are not read anymore
+        with open(log_path, 'r+b') as log_file:
+            log_file.write(b'#' * offset)
+        with GameJournal(self.directory) as recovered_journal:
+            self.assertEqual(getBoard(recovered_journal), board)
+
+    def test_snapshot_syncs_directory(self):
+        """
+        Tests if the directory is synced after the snapshot replaced the previous one, so that the new one survives
+        a crash
+        """
+        with GameJournal(self.directory, events_per_sync=1) as journal:
+            journal.openGame(["A"])
+            synced_directories = []
+
+            def fsync(fd):
+                if stat.S_ISDIR(os.fstat(fd).st_mode):
+                    synced_directories.append(fd)
+            with mock.patch('os.fsync', side_effect=fsync):
+                journal.snapshot()
+            self.assertEqual(len(synced_directories), 1)
+
+    def test_torn_event(self):
+        """
+        Tests if an event that was not completely written is ignored and removed from the log
+        """
+        with GameJournal(self.directory, events_per_sync=1) as journal:
+            self.playGames(journal)
+            board = getBoard(journal)
+        log_path = os.path.join(self.directory, LOG_NAME)
+        size = os.path.getsize(log_path)
+        with open(log_path, 'ab') as log_file:
+            log_file.write(b'{"event":"roll","game":1,"pla')
+        with GameJournal(self.directory) as recovered_journal:
+            self.assertEqual(getBoard(recovered_journal), board)
+            self.assertEqual(os.path.getsize(log_path), size)
+            recovered_journal.registerRoll(1, "A", 3)
+            board = getBoard(recovered_journal)
+        with GameJournal(self.directory) as recovered_journal:
+            self.assertEqual(getBoard(recovered_journal), board)
+
+    def test_buffered_events(self):
+        """
+        Tests if only the invalid throwing are not journaled, and if the events not synced yet are lost in a crash
+        """
+        journal = GameJournal(self.directory, events_per_sync=2)
+        game_id = journal.openGame(["A"])
+        with self.assertRaises(ValueError):
+            journal.registerRoll(game_id, "A", -1)
+        with self.assertRaises(ValueError):
+            journal.registerRoll(3, "A", 1)
+        journal.registerRoll(game_id, "A", 3)
+        journal.registerRoll(game_id, "A", 4)
+        # Crash: the last event is still in the buffer
+        journal._log.close()
+        with GameJournal(self.directory) as recovered_journal:
+            self.assertEqual(recovered_journal.getGame(game_id).frames["A"][0].getThrowing(), (3,))
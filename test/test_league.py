@@ -0,0 +1,67 @@
+from unittest import TestCase
+
+from bowling.game import BowlingGame
+from bowling.league import League
+
+
+def playGame(players, throwing_lists):
+    """
+    Plays a game in which each player performs the given throwing.
+    """
+    game = BowlingGame(players)
+    for player, throwing_list in zip(game.players, throwing_lists):
+        for nb_pins in throwing_list:
+            game.registerRoll(player, nb_pins)
+    return game
+
+
+class TestLeague(TestCase):
+    def test_player_statistics(self):
+        """
+        Tests if the average, the high game and the series totals of the players are updated with each game
+        """
+        league = League()
+        league.addGame(playGame(["A", "B"], [[10] * 12, [5] * 21]), series_id=1)
+        league.addGame(playGame(["A", "B"], [[0] * 20, [3, 4] * 10]), series_id=1)
+        league.addGame(playGame(["A"], [[3, 7] * 10 + [10]]), series_id=2)
+        record = league.getPlayer("A")
+        self.assertEqual(record.nbGames, 3)
+        self.assertEqual(record.totalPins, 300 + 0 + 137)
+        self.assertAlmostEqual(record.getAverage(), 437 / 3)
+        self.assertEqual(record.highGame, 300)
+        self.assertEqual(record.series, {1: 300, 2: 137})
+        self.assertEqual(record.getHighSeries(), 300)
+        self.assertEqual(league.getPlayer("B").series, {1: 150 + 70})
+        self.assertEqual(len(league), 5)
+
+    def test_standings(self):
+        """
+        Tests if the standings are sorted by average
+        """
+        league = League()
+        league.addScore("A", 150)
+        league.addScore("B", 200)
+        league.addScore("C", 100)
+        league.addScore("C", 250)
+        self.assertEqual(league.getStandings(), [("B", 200), ("C", 175), ("A", 150)])
+        self.assertEqual(league.getStandings(2), [("B", 200), ("C", 175)])
+
+    def test_leaderboard(self):
+        """
+        Tests if only the best games are kept in the leaderboard, the earliest one winning on equal scores
+        """
+        league = League(top_k=3)
+        for player, score in [("A", 120), ("B", 200), ("C", 180), ("D", 90), ("E", 200), ("F", 180), ("G", 210)]:
+            league.addScore(player, score)
+        self.assertEqual(league.getLeaderboard(), [("G", 210), ("B", 200), ("E", 200)])
+
+    def test_unfinished_game(self):
+        """
+        Tests if an unfinished game cannot be added to the league, and leaves it untouched
+        """
+        league = League()
+        with self.assertRaises(ValueError):
+            league.addGame(playGame(["A", "B"], [[10] * 12, [5] * 20]))
+        self.assertEqual(len(league), 0)
+        with self.assertRaises(ValueError):
+            league.getPlayer("A")
@@ -0,0 +1,37 @@
+from io import StringIO
+from unittest import TestCase
+
+from bowling.parallel import scoreParallel
+from bowling.stream import scoreStream
+
+
+class TestParallel(TestCase):
+    def test_same_as_stream(self):
+        """
+        Tests if the parallel scoring writes the same scores and errors as the sequential one, in the same order
+        """
+        games = ["10 " * 12, "3 7 5 1", "3 x", "2 3 6 4 8 1 10 3 0 10 10 10 10 1 9 5", "6 5", "3 7", ""] * 50
+        lines = [game + "\n" for game in games]
+        output = StringIO()
+        errors = StringIO()
+        parallel_output = StringIO()
+        parallel_errors = StringIO()
+        nb_errors = scoreStream(lines, output, errors)
+        self.assertEqual(scoreParallel(lines, parallel_output, parallel_errors, chunk_size=7, workers=2), nb_errors)
+        self.assertEqual(parallel_output.getvalue(), output.getvalue())
+        self.assertEqual(parallel_errors.getvalue(), errors.getvalue())
+
+    def test_empty_stream(self):
+        """
+        Tests if an empty stream gives an empty output
+        """
+        output = StringIO()
+        self.assertEqual(scoreParallel([], output, StringIO(), workers=1), 0)
+        self.assertEqual(output.getvalue(), "")
+
+    def test_bad_configuration(self):
+        """
+        Tests if the good error is raised when the chunks or the pool cannot be built
+        """
+        self.assertRaises(ValueError, scoreParallel, [], StringIO(), StringIO(), 0)
+        self.assertRaises(ValueError, scoreParallel, [], StringIO(), StringIO(), 10, 0)
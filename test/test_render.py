@@ -0,0 +1,67 @@
+from unittest import TestCase
+
+from bowling.frame import BowlingFrame
+from bowling.game import BowlingGame
+from bowling.render import ScoreboardRenderer
+
+
+def renderNaively(frames):
+    """
+    Renders a scoreboard by rendering every frame again.
+    """
+    string = "\n"
+    for player, player_frames in frames.items():
+        string += player + '\n'
+        for frame in player_frames:
+            string += frame.__str__() + ' '
+        string += '\n'
+        for frame in player_frames:
+            string += frame.__str__(True) + ' '
+        string += '\n\n'
+    return string
+
+
+class TestScoreboardRenderer(TestCase):
+    def test_render_while_playing(self):
+        """
+        Tests if the cached rendering stays identical to a full rendering after each throwing
+        """
+        game = BowlingGame(['first', 'second'])
+        for nb_pins in [2, 3, 6, 4, 8, 1, 10, 3, 0, 10, 10, 10, 10, 1, 9, 5]:
+            game.registerRoll('first', nb_pins)
+            self.assertEqual(str(game), renderNaively(game.frames))
+            game.registerRoll('second', min(nb_pins, 4))
+            self.assertEqual(str(game), renderNaively(game.frames))
+
+    def test_render_only_changed_frames(self):
+        """
+        Tests if the frames that did not change are not rendered again
+        """
+        renderer = ScoreboardRenderer()
+        frame1 = BowlingFrame("test")
+        frame1.registerThrowing(10)
+        frame2 = BowlingFrame("test")
+        frames = {"test": [frame1, frame2]}
+        renderer.render(frames)
+        cached_line = renderer._renderedFrames["test"][0][3]
+        frame2.registerThrowing(3)
+        self.assertEqual(renderer.render(frames), renderNaively(frames))
+        self.assertIs(renderer._renderedFrames["test"][0][3], cached_line)
+        frame2.registerThrowing(4)
+        frame1.computeScore(frame2)
+        self.assertEqual(renderer.render(frames), renderNaively(frames))
+        self.assertIsNot(renderer._renderedFrames["test"][0][3], cached_line)
+
+    def test_render_replaced_frames(self):
+        """
+        Tests if the rendering follows frames that are replaced or removed
+        """
+        renderer = ScoreboardRenderer()
+        frame = BowlingFrame("test")
+        frame.registerThrowing(3)
+        frames = {"test": [frame, BowlingFrame("test")]}
+        renderer.render(frames)
+        frames = {"test": [BowlingFrame("test")], "other": []}
+        self.assertEqual(renderer.render(frames), renderNaively(frames))
+        renderer.clear()
+        self.assertEqual(renderer.render(frames), renderNaively(frames))
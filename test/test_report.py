@@ -0,0 +1,76 @@
+import os
+import tempfile
+from io import StringIO
+from unittest import TestCase
+
+from bowling.game import BowlingGame
+from bowling.report import writeHtmlReport, writeReport, writeTextReport
+
+
+def playGame(players, throwing_list):
+    """
+    Plays a game in which every player performs the given throwing.
+    """
+    game = BowlingGame(players)
+    for nb_pins in throwing_list:
+        for player in game.players:
+            game.registerRoll(player, nb_pins)
+    return game
+
+
+class TestReport(TestCase):
+    def test_text_report(self):
+        """
+        Tests if the text report contains the same scoreboards as the string representation of the games
+        """
+        games = [playGame(["A", "B"], [2, 3, 6, 4, 8, 1, 10, 3, 0, 10, 10, 10, 10, 1, 9, 5]),
+                 playGame(["C"], [10] * 5)]
+        output = StringIO()
+        self.assertEqual(writeTextReport(games, output), 2)
+        self.assertEqual(output.getvalue(), "Game 1\n" + str(games[0]) + "Game 2\n" + str(games[1]))
+
+    def test_html_report(self):
+        """
+        Tests if the HTML report contains the marks and the scores of the frames, and escapes the names
+        """
+        game = playGame(["<A>"], [10] * 9 + [10, 5, 5])
+        output = StringIO()
+        self.assertEqual(writeHtmlReport([game], output), 1)
+        report = output.getvalue()
+        self.assertIn('<tr><th>&lt;A&gt;</th><td><div class="marks">  X</div><div class="score">30</div></td>',
+                      report)
+        self.assertIn('<div class="marks">X 5 /</div><div class="score">285</div></td><td>285</td></tr>', report)
+        self.assertTrue(report.endswith("</html>\n"))
+
+    def test_html_report_total(self):
+        """
+        Tests if the total of the HTML report is the score of the last scored frame, whatever the way the game is played
+        """
+        game = BowlingGame(["A"])
+        game.play([2, 3, 6, 4, 8, 1, 10, 3, 0, 10, 10, 10, 10, 1, 9, 5], verbose=False)
+        output = StringIO()
+        writeHtmlReport([game, playGame(["B"], [3, 4, 10, 5])], output)
+        report = output.getvalue()
+        self.assertIn('<div class="score">164</div></td><td>164</td></tr>', report)
+        self.assertIn('<div class="score">7</div></td><td><div class="marks">  X</div><div class="score"></div></td>'
+                      '<td><div class="marks">5  </div><div class="score"></div></td>' + '<td></td>' * 7 +
+                      '<td>7</td></tr>', report)
+
+    def test_write_report(self):
+        """
+        Tests if a report can be written in a file from a generator of games, in both formats
+        """
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, "report")
+        try:
+            games = (playGame(["A"], [3, 4] * 10) for _ in range(100))
+            self.assertEqual(writeReport(games, path, buffer_size=128), 100)
+            with open(path) as report_file:
+                self.assertEqual(report_file.read().count("| 70    |"), 100)
+            self.assertEqual(writeReport((playGame(["A"], [5]) for _ in range(3)), path, 'html'), 3)
+            with open(path) as report_file:
+                self.assertEqual(report_file.read().count('<table class="game">'), 3)
+            self.assertRaises(ValueError, writeReport, [], path, 'pdf')
+        finally:
+            os.remove(path)
+            os.rmdir(directory)
@@ -0,0 +1,118 @@
+import asyncio
+import json
+import os
+import tempfile
+from unittest import TestCase
+
+from bowling.server import MAX_REQUEST_SIZE, ScoringClient, ScoringServer
+
+GAME = [2, 3, 6, 4, 8, 1, 10, 3, 0, 10, 10, 10, 10, 1, 9, 5]
+
+
+class TestScoringServer(TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.server = ScoringServer()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_handle_request(self):
+        """
+        Tests if the requests are served correctly without any connection
+        """
+        response = self.server.handleRequest({'op': 'open', 'players': ['test', 'test']})
+        self.assertEqual(response, {'ok': True, 'game': 1, 'players': ['test', 'test_2']})
+        self.assertEqual(self.server.handleRequest({'op': 'roll', 'game': 1, 'player': 'test', 'pins': 10}),
+                         {'ok': True, 'changed': []})
+        self.assertEqual(self.server.handleRequest({'op': 'roll', 'game': 1, 'player': 'test', 'pins': 3}),
+                         {'ok': True, 'changed': []})
+        self.assertEqual(self.server.handleRequest({'op': 'roll', 'game': 1, 'player': 'test', 'pins': 4}),
+                         {'ok': True, 'changed': [[0, 17], [1, 24]]})
+        self.assertEqual(self.server.handleRequest({'op': 'board', 'game': 1}),
+                         {'ok': True, 'frames': {'test': [[10], [3, 4]], 'test_2': []},
+                          'scores': {'test': [17, 24], 'test_2': []}})
+        self.assertEqual(self.server.handleRequest({'op': 'close', 'game': 1}), {'ok': True})
+        self.assertEqual(self.server.games, {})
+
+    def test_handle_bad_request(self):
+        """
+        Tests if the requests that cannot be served give an error instead of stopping the server
+        """
+        self.server.handleRequest({'op': 'open', 'players': ['test']})
+        for request in ({'op': 'open', 'players': []}, {'op': 'roll', 'game': 2, 'player': 'test', 'pins': 1},
+                        {'op': 'roll', 'game': 1, 'player': 'test'},
+                        {'op': 'roll', 'game': 1, 'player': 'x', 'pins': 1},
+                        {'op': 'roll', 'game': 1, 'player': 'test', 'pins': 11}, {'op': 'unknown', 'game': 1}):
+            self.assertFalse(self.server.handleRequest(request)['ok'])
+
+    def test_request_too_long(self):
+        """
+        Tests if a request line longer than the limit gets an error, after which the server stops reading requests
+        """
+        async def sendLongLine():
+            server = await self.server.start()
+            port = server.sockets[0].getsockname()[1]
+            client = await ScoringClient.connect(port=port)
+            client._writer.write(b'{"op": "score", "throwing": [' + b'0, ' * MAX_REQUEST_SIZE + b'0]}\n')
+            response = await client._reader.readline()
+            end = await client._reader.read()
+            client.close()
+            other_client = await ScoringClient.connect(port=port)
+            game_id = await other_client.open(['test'])
+            other_client.close()
+            await self.server.stop()
+            return json.loads(response.decode()), end, game_id
+
+        response, end, game_id = self.loop.run_until_complete(sendLongLine())
+        self.assertFalse(response['ok'])
+        self.assertEqual(end, b'')
+        self.assertEqual(game_id, 1)
+
+    def test_many_lanes(self):
+        """
+        Tests if hundreds of simulated lanes can play concurrently on the server
+        """
+        nb_lanes = 200
+
+        async def playLane(port):
+            client = await ScoringClient.connect(port=port)
+            game_id = await client.open(['first', 'second'])
+            for index in range(21):
+                if index < len(GAME):
+                    await client.roll(game_id, 'first', GAME[index])
+                await client.roll(game_id, 'second', 5)
+            board = await client.board(game_id)
+            await client.closeGame(game_id)
+            client.close()
+            return board['scores']['first'][-1], board['scores']['second'][-1]
+
+        async def playAllLanes():
+            server = await self.server.start()
+            port = server.sockets[0].getsockname()[1]
+            scores = await asyncio.gather(*[playLane(port) for _ in range(nb_lanes)])
+            await self.server.stop()
+            return scores
+
+        self.assertEqual(self.loop.run_until_complete(playAllLanes()), [(164, 150)] * nb_lanes)
+        self.assertEqual(self.server.games, {})
+
+    def test_unix_socket(self):
+        """
+        Tests if the server can be reached on a Unix socket
+        """
+        async def play(path):
+            await self.server.start(path=path)
+            client = await ScoringClient.connect(path=path)
+            game_id = await client.open(['test'])
+            for _ in range(12):
+                await client.roll(game_id, 'test', 10)
+            with self.assertRaises(ValueError):
+                await client.roll(game_id, 'test', 10)
+            board = await client.board(game_id)
+            client.close()
+            await self.server.stop()
+            return board['scores']['test'][-1]
+
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertEqual(self.loop.run_until_complete(play(os.path.join(directory, "bowling.sock"))), 300)
@@ -0,0 +1,65 @@
+from unittest import TestCase
+
+from bowling.analysis import computeExpectedScore, computeScoreDistribution
+from bowling.simulation import SkillModel, simulateBatch, simulateGames
+
+
+class TestSimulation(TestCase):
+    def test_deterministic(self):
+        """
+        Tests if a player always knocking down the same pins always gets the same score
+        """
+        self.assertEqual(simulateBatch(SkillModel([0] * 10 + [1]), 0, 10), [300] * 10)
+        self.assertEqual(simulateBatch(SkillModel([0] * 9 + [1, 0]), 0, 10), [90] * 10)
+        self.assertEqual(simulateBatch(SkillModel([0] * 5 + [1] + [0] * 5, 1.0), 0, 10), [150] * 10)
+
+    def test_reproducible(self):
+        """
+        Tests if the same seed gives the same scores, whatever the number of processes
+        """
+        model = SkillModel([0.02, 0.02, 0.03, 0.03, 0.05, 0.05, 0.1, 0.15, 0.2, 0.15, 0.2], 0.6)
+        scores = [score for batch in simulateGames(model, 250, seed=7, batch_size=100) for score in batch]
+        self.assertEqual(len(scores), 250)
+        self.assertEqual(scores[:100], simulateBatch(model, 0, 100, seed=7))
+        parallel_scores = [score for batch in simulateGames(model, 250, seed=7, batch_size=100, workers=2)
+                           for score in batch]
+        self.assertEqual(parallel_scores, scores)
+        other_scores = [score for batch in simulateGames(model, 250, seed=8, batch_size=100) for score in batch]
+        self.assertNotEqual(other_scores, scores)
+
+    def test_many_batches(self):
+        """
+        Tests if the batches are given in order when there are more batches than the processes keep in progress
+        """
+        model = SkillModel([0.02, 0.02, 0.03, 0.03, 0.05, 0.05, 0.1, 0.15, 0.2, 0.15, 0.2], 0.6)
+        batches = list(simulateGames(model, 205, seed=3, batch_size=10))
+        self.assertEqual([len(batch) for batch in batches], [10] * 20 + [5])
+        self.assertEqual(list(simulateGames(model, 205, seed=3, batch_size=10, workers=2)), batches)
+        self.assertEqual(list(simulateGames(model, 0, batch_size=10, workers=2)), [])
+
+    def test_expected_score(self):
+        """
+        Tests if the average simulated score is close to the exact expected score of the same skill model
+        """
+        first_ball = [0, 0.02, 0.03, 0.03, 0.05, 0.07, 0.1, 0.15, 0.2, 0.15, 0.2]
+        spare_conversion = [0, 0.9, 0.8, 0.7, 0.6, 0.5, 0.4, 0.3, 0.2, 0.1, 0.05]
+        model = SkillModel(first_ball, spare_conversion)
+        # Equivalent distribution of the knocked down pins for each number of standing pins
+        pin_distribution = {10: first_ball}
+        for standing in range(1, 10):
+            miss = (1 - spare_conversion[standing]) / standing
+            pin_distribution[standing] = [miss] * standing + [spare_conversion[standing]]
+        expected_score = computeExpectedScore(computeScoreDistribution(pin_distribution))
+        scores = simulateBatch(model, 0, 20000, seed=3)
+        self.assertAlmostEqual(sum(scores) / len(scores), expected_score, delta=1)
+
+    def test_invalid_model(self):
+        """
+        Tests if invalid probabilities are refused
+        """
+        with self.assertRaises(ValueError):
+            SkillModel([0.1] * 10)
+        with self.assertRaises(ValueError):
+            SkillModel([0.5] * 11)
+        with self.assertRaises(ValueError):
+            SkillModel([0] * 10 + [1], 2)
@@ -0,0 +1,50 @@
+from io import StringIO
+from unittest import TestCase
+
+from bowling.stream import scoreLine, scoreStream, LINES_PER_WRITE
+
+
+class TestStream(TestCase):
+    def test_score_line(self):
+        """
+        Tests if the score of a game written on a line is computed correctly
+        """
+        self.assertEqual(scoreLine("2 3 6 4 8 1 10 3 0 10 10 10 10 1 9 5\n"), 164)
+        self.assertEqual(scoreLine("3 7 5 1"), 21)
+        self.assertEqual(scoreLine("\n"), 0)
+
+    def test_score_stream(self):
+        """
+        Tests if one score is written per game
+        """
+        lines = StringIO("10 10 10 10 10 10 10 10 10 10 10 10\n3 7 5 1\n3 7\n")
+        output = StringIO()
+        errors = StringIO()
+        self.assertEqual(scoreStream(lines, output, errors), 0)
+        self.assertEqual(output.getvalue(), "300\n21\nNone\n")
+        self.assertEqual(errors.getvalue(), "")
+
+    def test_score_stream_malformed(self):
+        """
+        Tests if the malformed lines are reported without stopping the stream, and keep the lines aligned
+        """
+        lines = StringIO("3 7 5 1\n3 x\n6 5\n2 3 6\n1 1\n")
+        output = StringIO()
+        errors = StringIO()
+        self.assertEqual(scoreStream(lines, output, errors), 3)
+        self.assertEqual(output.getvalue(), "21\n\n\n\n2\n")
+        reported = errors.getvalue().splitlines()
+        self.assertEqual(len(reported), 3)
+        self.assertTrue(reported[0].startswith("line 2:"))
+        self.assertTrue(reported[1].startswith("line 3:"))
+        self.assertTrue(reported[2].startswith("line 4:"))
+
+    def test_score_stream_many_lines(self):
+        """
+        Tests if all the scores are written when the stream is longer than one write
+        """
+        nb_games = 2 * LINES_PER_WRITE + 3
+        lines = ("1 1\n" for _ in range(nb_games))
+        output = StringIO()
+        self.assertEqual(scoreStream(lines, output, StringIO()), 0)
+        self.assertEqual(output.getvalue(), "2\n" * nb_games)
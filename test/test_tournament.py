@@ -0,0 +1,97 @@
+from unittest import TestCase
+
+from bowling.game import BowlingGame
+from bowling.tournament import Bracket, Tournament
+
+
+class TestTournament(TestCase):
+    def test_squads(self):
+        """
+        Tests if the bowlers are split into squads filling all the lanes, in the order of registration
+        """
+        tournament = Tournament(nb_lanes=2, players_per_lane=2)
+        for index in range(9):
+            tournament.addBowler("B%d" % index)
+        self.assertEqual(tournament.getSquads(), [["B0", "B1", "B2", "B3"], ["B4", "B5", "B6", "B7"], ["B8"]])
+        with self.assertRaises(ValueError):
+            tournament.addBowler("B3")
+
+    def test_lane_rotation(self):
+        """
+        Tests if the bowlers of a lane move together to the next lanes after each game
+        """
+        tournament = Tournament(nb_lanes=3, players_per_lane=2)
+        for index in range(6):
+            tournament.addBowler("B%d" % index)
+        self.assertEqual(tournament.getLaneAssignment(0, 0), {0: ["B0", "B1"], 1: ["B2", "B3"], 2: ["B4", "B5"]})
+        self.assertEqual(tournament.getLaneAssignment(0, 1), {1: ["B0", "B1"], 2: ["B2", "B3"], 0: ["B4", "B5"]})
+        self.assertEqual(tournament.getLaneAssignment(0, 3), tournament.getLaneAssignment(0, 0))
+        games = tournament.createGames(0, 2)
+        self.assertEqual(games[2].players, ["B0", "B1"])
+        with self.assertRaises(ValueError):
+            tournament.getLaneAssignment(1, 0)
+
+    def test_standings(self):
+        """
+        Tests if the standings follow the recorded and corrected scores
+        """
+        tournament = Tournament(nb_lanes=1, players_per_lane=3)
+        for bowler in ["A", "B", "C"]:
+            tournament.addBowler(bowler)
+        game = BowlingGame(["A", "B", "C"])
+        for player, throwing_list in zip(game.players, [[10] * 12, [5] * 21, [3, 4] * 10]):
+            for nb_pins in throwing_list:
+                game.registerRoll(player, nb_pins)
+        tournament.recordGame(game, 0)
+        self.assertEqual(tournament.getStandings(), [("A", 300), ("B", 150), ("C", 70)])
+        tournament.recordScore("C", 1, 200)
+        tournament.recordScore("B", 1, 120)
+        # On equal totals, the earliest registered bowler comes first
+        self.assertEqual(tournament.getStandings(), [("A", 300), ("B", 270), ("C", 270)])
+        # Correcting a score replaces it in the total
+        tournament.recordScore("C", 1, 190)
+        self.assertEqual(tournament.getStandings(2), [("A", 300), ("B", 270)])
+        self.assertEqual(tournament.getScores("C"), {0: 70, 1: 190})
+        with self.assertRaises(ValueError):
+            tournament.recordScore("D", 0, 100)
+        with self.assertRaises(ValueError):
+            tournament.recordGame(BowlingGame(["A"]), 2)
+
+    def test_cut(self):
+        """
+        Tests if the best bowlers of the qualifying are seeded in the bracket
+        """
+        tournament = Tournament(nb_lanes=2)
+        for index, total in enumerate([150, 300, 200, 180]):
+            tournament.addBowler("B%d" % index)
+            tournament.recordScore("B%d" % index, 0, total)
+        bracket = tournament.getCut(3)
+        self.assertEqual(bracket.seeds, ["B1", "B2", "B3"])
+        self.assertEqual(bracket.getMatches(), [("B1", None), ("B2", "B3")])
+
+
+class TestBracket(TestCase):
+    def test_rounds(self):
+        """
+        Tests if the winners of each round are paired until a champion is left, the best seed winning ties
+        """
+        bracket = Bracket(["A", "B", "C", "D", "E"])
+        self.assertEqual(bracket.getMatches(), [("A", None), ("B", None), ("C", None), ("D", "E")])
+        bracket.recordRound({"D": 150, "E": 180})
+        self.assertEqual(bracket.getMatches(), [("A", "E"), ("B", "C")])
+        with self.assertRaises(ValueError):
+            bracket.recordRound({"A": 200})
+        bracket.recordRound({"A": 200, "E": 210, "B": 170, "C": 170})
+        self.assertEqual(bracket.getMatches(), [("B", "E")])
+        self.assertIsNone(bracket.getChampion())
+        bracket.recordRound({"B": 190, "E": 230})
+        self.assertEqual(bracket.getChampion(), "E")
+        self.assertEqual(bracket.getMatches(), [])
+        with self.assertRaises(ValueError):
+            bracket.recordRound({})
+
+    def test_single_bowler(self):
+        """
+        Tests if the only bowler of a bracket is its champion
+        """
+        self.assertEqual(Bracket(["A"]).getChampion(), "A")
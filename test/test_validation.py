@@ -0,0 +1,42 @@
+from unittest import TestCase
+
+from bowling.validation import validateGame, validateGames, VALID, NEGATIVE_PINS, FRAME_OVERFLOW, \
+    TENTH_FRAME_BONUS, TOO_MANY_ROLLS, UNFINISHED_FRAME
+
+
+class TestValidation(TestCase):
+    def test_valid_games(self):
+        """
+        Tests if valid games are recognized as such
+        """
+        games = [[10] * 12, [5] * 21, [0] * 20, [2, 3, 6, 4, 8, 1, 10, 3, 0, 10, 10, 10, 10, 1, 9, 5],
+                 [0] * 18 + [10, 3, 7], [0] * 18 + [10, 10, 4], [0] * 18 + [3, 7, 10]]
+        self.assertEqual(validateGames(games), ([VALID] * len(games), [-1] * len(games)))
+
+    def test_errors(self):
+        """
+        Tests if the good error code and offset are given for each kind of invalid game
+        """
+        games = [[3, -1], [6, 5], [11], [0] * 18 + [10, 3, 8], [0] * 18 + [10, 11, 0], [0] * 18 + [3, 7, 11],
+                 [0] * 18 + [3, 9, 1], [0] * 20 + [1], [10] * 13, [2, 3, 6], [10] * 11, [0] * 18 + [4, 6]]
+        codes, offsets = validateGames(games)
+        self.assertEqual(codes, [NEGATIVE_PINS, FRAME_OVERFLOW, FRAME_OVERFLOW, TENTH_FRAME_BONUS, TENTH_FRAME_BONUS,
+                                 TENTH_FRAME_BONUS, FRAME_OVERFLOW, TOO_MANY_ROLLS, TOO_MANY_ROLLS, UNFINISHED_FRAME,
+                                 UNFINISHED_FRAME, UNFINISHED_FRAME])
+        self.assertEqual(offsets, [1, 1, 0, 20, 19, 20, 19, 20, 12, 3, 11, 20])
+
+    def test_partial_games(self):
+        """
+        Tests if the games stopping before the tenth frame are only valid when partial games are allowed
+        """
+        self.assertEqual(validateGame([3, 7, 5, 1]), (UNFINISHED_FRAME, 4))
+        self.assertEqual(validateGame([3, 7, 5, 1], partial=True), (VALID, -1))
+        self.assertEqual(validateGame([3, 7, 5], partial=True), (UNFINISHED_FRAME, 3))
+        self.assertEqual(validateGame([], partial=True), (VALID, -1))
+
+    def test_padding(self):
+        """
+        Tests if the padding of the rows is ignored
+        """
+        games = [[10] * 12 + [-1] * 9, [3, 7, 5, 1] + [-1] * 17, [5, -2] + [-1] * 19]
+        self.assertEqual(validateGames(games, padding=-1, partial=True), ([VALID, VALID, NEGATIVE_PINS], [-1, -1, 1]))